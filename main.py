@@ -1,7 +1,65 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
-from collections import deque
+
+# (dx, dy, wall_dx, wall_dy) steps to the next cell two squares away and the
+# wall between; order is Down, Right, Up, Left
+CARVE_DIRECTIONS = ((0, 2, 0, 1), (2, 0, 1, 0), (0, -2, 0, -1), (-2, 0, -1, 0))
+
+CELL_COLORS = ('#ffffff', '#000000')  # Path (0), wall (1)
+
+# bytes.translate table turning maze cells into binary digits: path -> '1', wall -> '0'
+OPEN_BIT_DIGITS = bytes([ord('1'), ord('0')]) + bytes(254)
+
+# Key name -> (dx, dy) player movement
+MOVE_KEYS = {
+    'up': (0, -1), 'w': (0, -1),
+    'down': (0, 1), 's': (0, 1),
+    'left': (-1, 0), 'a': (-1, 0),
+    'right': (1, 0), 'd': (1, 0),
+}
+
+
+def carve_maze(maze, width, height, start_x, start_y, rng=random):
+    """Carve passages into an all-wall flat grid with an iterative backtracker"""
+    # Stack for backtracking, preallocated (it never holds more than one
+    # entry per cell) and addressed through the top pointer sp
+    stack_x = [0] * (width * height)
+    stack_y = [0] * (width * height)
+
+    maze[start_y * width + start_x] = 0
+    stack_x[0], stack_y[0] = start_x, start_y
+    sp = 1
+
+    # Fixed-size buffer of usable CARVE_DIRECTIONS entries, reused every step
+    candidates = [None] * 4
+    max_x, max_y = width - 1, height - 1
+    randrange = rng.randrange
+
+    while sp:
+        current_x, current_y = stack_x[sp - 1], stack_y[sp - 1]
+        count = 0
+
+        # Find unvisited neighbors
+        for direction in CARVE_DIRECTIONS:
+            nx, ny = current_x + direction[0], current_y + direction[1]
+            if 0 < nx < max_x and 0 < ny < max_y and maze[ny * width + nx] == 1:
+                candidates[count] = direction
+                count += 1
+
+        if count:
+            # Choose random neighbor
+            dx, dy, wall_x, wall_y = candidates[randrange(count)]
+            nx, ny = current_x + dx, current_y + dy
+
+            # Remove wall between current cell and chosen neighbor
+            maze[(current_y + wall_y) * width + current_x + wall_x] = 0
+            maze[ny * width + nx] = 0
+
+            stack_x[sp], stack_y[sp] = nx, ny
+            sp += 1
+        else:
+            sp -= 1
 
 
 class MazeGame:
@@ -10,8 +68,21 @@ class MazeGame:
         self.height = height
         self.cell_size = 20
         self.maze = []
+        self.drawn_rows = [None] * height  # Row contents currently on canvas
         self.player_pos = [1, 1]  # Starting position
         self.end_pos = [width - 2, height - 2]  # End position
+        self.win_pending = False  # Win message scheduled or showing
+        self.rng = random.Random()  # Seeded once, shared by every maze generation
+        self.draw_pending = False  # Maze redraw scheduled for the next idle
+
+        # Canvas geometry per cell, indexed like the flat maze (y * width + x)
+        cs = self.cell_size
+        self.cell_boxes = [
+            (x * cs, y * cs, x * cs + cs, y * cs + cs)
+            for y in range(height) for x in range(width)
+        ]
+        self.cell_centers = [(x1 + cs // 2, y1 + cs // 2) for x1, y1, _, _ in self.cell_boxes]
+        self.player_radius = cs // 3
 
         # Create the main window
         self.root = tk.Tk()
@@ -43,89 +114,68 @@ class MazeGame:
         self.root.focus_set()
 
         # Generate initial maze
+        self.create_canvas_items()
         self.generate_maze()
         self.draw_maze()
 
     def generate_maze(self):
         """Generate maze using recursive backtracking algorithm"""
-        # Initialize maze with walls (1) and paths (0)
-        self.maze = [[1 for _ in range(self.width)] for _ in range(self.height)]
-
-        # Stack for backtracking
-        stack = []
-
-        # Start from position (1,1)
-        start_x, start_y = 1, 1
-        self.maze[start_y][start_x] = 0
-        stack.append((start_x, start_y))
-
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]  # Right, Down, Left, Up
-
-        while stack:
-            current_x, current_y = stack[-1]
-            neighbors = []
+        width, height = self.width, self.height
 
-            # Find unvisited neighbors
-            for dx, dy in directions:
-                nx, ny = current_x + dx, current_y + dy
-                if (0 < nx < self.width - 1 and 0 < ny < self.height - 1 and
-                        self.maze[ny][nx] == 1):
-                    neighbors.append((nx, ny, dx // 2, dy // 2))
+        # Initialize maze with walls (1) and paths (0), one byte per cell,
+        # stored row-major in a flat buffer indexed by y * width + x
+        maze = bytearray(b'\x01') * (width * height)
 
-            if neighbors:
-                # Choose random neighbor
-                nx, ny, wall_x, wall_y = random.choice(neighbors)
-
-                # Remove wall between current cell and chosen neighbor
-                self.maze[current_y + wall_y][current_x + wall_x] = 0
-                self.maze[ny][nx] = 0
-
-                stack.append((nx, ny))
-            else:
-                stack.pop()
+        carve_maze(maze, width, height, 1, 1, self.rng)
 
         # Ensure start and end positions are clear
-        self.maze[1][1] = 0  # Start
-        self.maze[self.height - 2][self.width - 2] = 0  # End
+        maze[width + 1] = 0  # Start
+        maze[(height - 2) * width + width - 2] = 0  # End
+
+        self.maze = maze
 
     def draw_maze(self):
-        """Draw the maze on canvas"""
-        self.canvas.delete("all")
-
-        for y in range(self.height):
-            for x in range(self.width):
-                x1, y1 = x * self.cell_size, y * self.cell_size
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-
-                if self.maze[y][x] == 1:  # Wall
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='black', outline='black')
-                else:  # Path
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='white', outline='lightgray')
-
-        # Draw start position (green)
-        start_x, start_y = 1, 1
-        x1, y1 = start_x * self.cell_size + 2, start_y * self.cell_size + 2
-        x2, y2 = x1 + self.cell_size - 4, y1 + self.cell_size - 4
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill='lightgreen', outline='green')
-
-        # Draw end position (red)
+        """Draw the maze on canvas, repainting only rows that changed"""
+        # The maze is painted into a one-pixel-per-cell image, which is then
+        # scaled up and shown as a single canvas item
+        changed = False
+        width = self.width
+        with memoryview(self.maze) as view:
+            for y in range(self.height):
+                # Zero-copy row slice; only changed rows are copied out
+                row = view[y * width:(y + 1) * width]
+                if self.drawn_rows[y] == row:
+                    continue
+
+                pixels = " ".join(CELL_COLORS[cell] for cell in row)
+                self.maze_image.put("{" + pixels + "}", to=(0, y))
+                self.drawn_rows[y] = row.tobytes()
+                changed = True
+
+        if changed:
+            self.maze_image_scaled = self.maze_image.zoom(self.cell_size, self.cell_size)
+            self.canvas.itemconfig(self.maze_item, image=self.maze_image_scaled)
+
+    def create_canvas_items(self):
+        """Create the maze image, start/end markers and the player once"""
+        self.maze_image = tk.PhotoImage(width=self.width, height=self.height)
+        self.maze_image_scaled = None
+        self.maze_item = self.canvas.create_image(0, 0, anchor='nw', tags="maze")
+
+        # Start position (green)
+        x1, y1, x2, y2 = self.cell_boxes[self.width + 1]
+        self.canvas.create_rectangle(x1 + 2, y1 + 2, x2 - 2, y2 - 2, fill='lightgreen', outline='green', tags="marker")
+
+        # End position (red)
         end_x, end_y = self.end_pos
-        x1, y1 = end_x * self.cell_size + 2, end_y * self.cell_size + 2
-        x2, y2 = x1 + self.cell_size - 4, y1 + self.cell_size - 4
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill='lightcoral', outline='red')
+        x1, y1, x2, y2 = self.cell_boxes[end_y * self.width + end_x]
+        self.canvas.create_rectangle(x1 + 2, y1 + 2, x2 - 2, y2 - 2, fill='lightcoral', outline='red', tags="marker")
 
-        # Draw player (blue circle)
-        self.draw_player()
-
-    def draw_player(self):
-        """Draw player at current position"""
-        self.canvas.delete("player")
+        # Player (blue circle), created once and afterwards only moved
         px, py = self.player_pos
-        center_x = px * self.cell_size + self.cell_size // 2
-        center_y = py * self.cell_size + self.cell_size // 2
-        radius = self.cell_size // 3
-
-        self.canvas.create_oval(
+        center_x, center_y = self.cell_centers[py * self.width + px]
+        radius = self.player_radius
+        self.player_id = self.canvas.create_oval(
             center_x - radius, center_y - radius,
             center_x + radius, center_y + radius,
             fill='blue', outline='darkblue', tags="player"
@@ -133,64 +183,97 @@ class MazeGame:
 
     def on_key_press(self, event):
         """Handle keyboard input for player movement"""
-        key = event.keysym.lower()
-
-        new_x, new_y = self.player_pos
-
-        if key == 'up' or key == 'w':
-            new_y -= 1
-        elif key == 'down' or key == 's':
-            new_y += 1
-        elif key == 'left' or key == 'a':
-            new_x -= 1
-        elif key == 'right' or key == 'd':
-            new_x += 1
-        else:
+        if self.win_pending:
             return
 
+        move = MOVE_KEYS.get(event.keysym.lower())
+        if move is None:
+            return
+
+        dx, dy = move
+        new_x, new_y = self.player_pos[0] + dx, self.player_pos[1] + dy
+
         # Check if move is valid
         if (0 <= new_x < self.width and 0 <= new_y < self.height and
-                self.maze[new_y][new_x] == 0):
+                self.maze[new_y * self.width + new_x] == 0):
             self.player_pos = [new_x, new_y]
-            self.draw_player()
+            self.canvas.move(self.player_id, dx * self.cell_size, dy * self.cell_size)
 
-            # Check if player reached the end
+            # Check if player reached the end; the message is shown from the
+            # event loop so this key handler returns immediately
             if self.player_pos == self.end_pos:
-                messagebox.showinfo("Congratulations!", "You solved the maze!")
+                self.win_pending = True
+                self.root.after(0, self.show_win_message)
+
+    def show_win_message(self):
+        """Show the win message, ignoring movement keys until it is closed"""
+        messagebox.showinfo("Congratulations!", "You solved the maze!")
+        self.win_pending = False
 
     def generate_new_maze(self):
         """Generate a new random maze"""
         self.generate_maze()
         self.reset_player()
+        self.canvas.delete("solution")
+        self.schedule_draw()
+
+    def schedule_draw(self):
+        """Redraw the maze once the event loop is idle, collapsing bursts"""
+        if not self.draw_pending:
+            self.draw_pending = True
+            self.root.after_idle(self.flush_draw)
+
+    def flush_draw(self):
+        """Run a scheduled maze redraw"""
+        self.draw_pending = False
         self.draw_maze()
 
     def reset_player(self):
         """Reset player to starting position"""
+        px, py = self.player_pos
         self.player_pos = [1, 1]
-        self.draw_player()
+        self.canvas.move(self.player_id, (1 - px) * self.cell_size, (1 - py) * self.cell_size)
 
     def find_path(self, start, end):
-        """Use BFS to find path from start to end"""
-        queue = deque([(start, [start])])
-        visited = set([tuple(start)])
-
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-        while queue:
-            (x, y), path = queue.popleft()
-
-            if [x, y] == end:
-                return path
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-
-                if (0 <= nx < self.width and 0 <= ny < self.height and
-                        self.maze[ny][nx] == 0 and (nx, ny) not in visited):
-                    visited.add((nx, ny))
-                    queue.append(([nx, ny], path + [[nx, ny]]))
-
-        return None
+        """Find a shortest path from start to end with a bit-parallel flood fill"""
+        width = self.width
+        start_pos = start[1] * width + start[0]
+        end_pos = end[1] * width + end[0]
+
+        # Pack open cells into one integer, bit i set when flat cell i is a path;
+        # the digit string is reversed so cell 0 lands on the lowest bit
+        open_bits = int(self.maze.translate(OPEN_BIT_DIGITS)[::-1], 2)
+
+        # Pass 1: grow the reached set one step at a time, keeping each layer.
+        # Shifting by 1 / width moves every frontier cell left/right/up/down at
+        # once; the wall border stops shifts from wrapping between rows
+        end_bit = 1 << end_pos
+        frontier = reached = (1 << start_pos) & open_bits
+        layers = [frontier]
+        add_layer = layers.append
+        while not frontier & end_bit:
+            frontier = (
+                (frontier << 1) | (frontier >> 1) |
+                (frontier << width) | (frontier >> width)
+            ) & open_bits & ~reached
+            if not frontier:
+                return None
+            reached |= frontier
+            add_layer(frontier)
+
+        # Pass 2: walk back from end, stepping to any neighbor one layer closer
+        offsets = (width, 1, -width, -1)
+        pos = end_pos
+        path = [[pos % width, pos // width]]
+        append = path.append
+        for layer in reversed(layers[:-1]):
+            for offset in offsets:
+                if layer >> (pos + offset) & 1:
+                    pos += offset
+                    break
+            append([pos % width, pos // width])
+        path.reverse()
+        return path
 
     def show_solution(self):
         """Show the solution path"""
@@ -199,18 +282,14 @@ class MazeGame:
         if path:
             self.canvas.delete("solution")
 
-            for i in range(len(path) - 1):
-                x1, y1 = path[i]
-                x2, y2 = path[i + 1]
-
-                center1_x = x1 * self.cell_size + self.cell_size // 2
-                center1_y = y1 * self.cell_size + self.cell_size // 2
-                center2_x = x2 * self.cell_size + self.cell_size // 2
-                center2_y = y2 * self.cell_size + self.cell_size // 2
+            # One polyline item for the whole path
+            points = []
+            for x, y in path:
+                points.extend(self.cell_centers[y * self.width + x])
 
+            if len(path) > 1:
                 self.canvas.create_line(
-                    center1_x, center1_y, center2_x, center2_y,
-                    fill='orange', width=3, tags="solution"
+                    *points, fill='orange', width=3, capstyle='round', tags="solution"
                 )
         else:
             messagebox.showwarning("No Solution", "No path found!")
@@ -1,10 +1,280 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
-from collections import deque
+from array import array
+from heapq import heappop, heappush
+from itertools import count
 import time
 import math
 
+# Cell kinds in HardMazeGame.cell_kinds
+CELL_OPEN, CELL_WALL, CELL_TRAP = 0, 1, 2
+
+# Maximum number of cached find_path results and distance fields per maze
+PATH_CACHE_SIZE = 64
+DISTANCE_FIELD_CACHE_SIZE = 8
+
+
+def distance_field(flat_maze, width, source_index):
+    """Number of steps from source_index to every cell of a flat maze
+
+    Uses the same grid layout as bfs_kernel. Walls and cells that cannot be
+    reached get len(flat_maze), which is longer than any real path.
+    """
+    unreached = len(flat_maze)
+    dist = [unreached] * unreached
+    dist[source_index] = 0
+    # FIFO queue in a preallocated array: every cell is queued at most once,
+    # so head and tail only move forward and never wrap
+    queue = array("i", [0]) * unreached
+    queue[0] = source_index
+    head, tail = 0, 1
+
+    while head < tail:
+        index = queue[head]
+        head += 1
+        step = dist[index] + 1
+        for next_index in (index + width, index + 1, index - width, index - 1):
+            if not flat_maze[next_index] and dist[next_index] == unreached:
+                dist[next_index] = step
+                queue[tail] = next_index
+                tail += 1
+    return dist
+
+
+def bfs_kernel(flat_maze, width, start_index, end_index):
+    """Grid BFS core for find_path_bfs
+
+    flat_maze is a flat bytearray indexed by y * width + x (non-zero = wall);
+    the maze's outer wall border keeps every neighbor offset in bounds.
+    Returns (parent, nodes_explored) where parent maps a flat cell index to
+    its parent's flat index (-1 for start), or (None, nodes_explored) when
+    end cannot be reached.
+    """
+    parent = [-1] * len(flat_maze)
+    visited = bytearray(len(flat_maze))
+    visited[start_index] = 1
+    # FIFO queue in a preallocated array, as in distance_field
+    queue = array("i", [0]) * len(flat_maze)
+    queue[0] = start_index
+    head, tail = 0, 1
+    nodes_explored = 0
+
+    while head < tail:
+        index = queue[head]
+        head += 1
+        nodes_explored += 1
+
+        if index == end_index:
+            return parent, nodes_explored
+
+        # Down, right, up, left
+        for next_index in (index + width, index + 1, index - width, index - 1):
+            if not flat_maze[next_index] and not visited[next_index]:
+                visited[next_index] = 1
+                parent[next_index] = index
+                queue[tail] = next_index
+                tail += 1
+    return None, nodes_explored
+
+
+def dls_kernel(flat_maze, width, start_index, end_index, depth_limit, dist=None):
+    """Depth-limited DFS core for find_path_dls
+
+    Same grid layout as bfs_kernel. A cell is expanded again only when it is
+    reached by a strictly shorter route than before. dist, if given, is the
+    distance_field of end_index; cells too far from end to reach it within
+    the limit are then skipped. Returns (path, nodes_explored) where path is
+    the list of flat indices from start to end, or (None, nodes_explored)
+    when end is not within depth_limit steps.
+    """
+    if depth_limit < 0:
+        return None, 0
+    if start_index == end_index:
+        return [start_index], 1
+
+    offsets = (width, 1, -width, -1)  # Down, right, up, left
+    # Shallowest depth each cell has been reached at in this search
+    best_depth = [depth_limit + 1] * len(flat_maze)
+    best_depth[start_index] = 0
+    # The stack holds the current path: cell and next offset to try per depth
+    stack_cell = [0] * (depth_limit + 1)
+    stack_move = [0] * (depth_limit + 1)
+    stack_cell[0] = start_index
+    depth = 0
+    nodes_explored = 1
+
+    while depth >= 0:
+        move = stack_move[depth]
+        if move == 4 or depth == depth_limit:
+            depth -= 1  # All neighbors tried or at the limit: backtrack
+            continue
+        stack_move[depth] = move + 1
+
+        next_index = stack_cell[depth] + offsets[move]
+        next_depth = depth + 1
+        if flat_maze[next_index] or best_depth[next_index] <= next_depth:
+            continue
+        if dist is not None and next_depth + dist[next_index] > depth_limit:
+            continue
+
+        best_depth[next_index] = next_depth
+        nodes_explored += 1
+        if next_index == end_index:
+            return stack_cell[:next_depth] + [next_index], nodes_explored
+
+        stack_cell[next_depth] = next_index
+        stack_move[next_depth] = 0
+        depth = next_depth
+
+    return None, nodes_explored
+
+
+def ucs_kernel(flat_maze, width, start_index, end_index, dist):
+    """Uniform-cost (A*) core for find_path_ucs
+
+    Same grid layout as bfs_kernel; dist is the distance_field of end_index,
+    used as the heuristic. Returns (parent, nodes_explored) like bfs_kernel.
+    """
+    size = len(flat_maze)
+    best_cost = [size] * size  # Cheapest known cost to each cell
+    best_cost[start_index] = 0
+    parent = [-1] * size
+    visited = bytearray(size)
+    # (cost + heuristic, insertion order, cost, cell); the counter keeps
+    # equal-priority entries first in, first out. Entries made stale by a
+    # cheaper route are skipped when popped
+    order = count()
+    heap = [(dist[start_index], next(order), 0, start_index)]
+    nodes_explored = 0
+
+    while heap:
+        _, _, cost, index = heappop(heap)
+        nodes_explored += 1
+
+        if visited[index] or cost > best_cost[index]:
+            continue
+        visited[index] = 1
+
+        if index == end_index:
+            return parent, nodes_explored
+
+        new_cost = cost + 1  # Each step costs 1
+        for next_index in (index + width, index + 1, index - width, index - 1):
+            if (
+                not flat_maze[next_index]
+                and not visited[next_index]
+                and new_cost < best_cost[next_index]
+            ):
+                best_cost[next_index] = new_cost
+                parent[next_index] = index
+                priority = new_cost + dist[next_index]
+                heappush(heap, (priority, next(order), new_cost, next_index))
+    return None, nodes_explored
+
+
+def dfs_kernel(flat_maze, width, start_index, end_index):
+    """Randomized DFS core for find_path_dfs
+
+    Same grid layout and return value as bfs_kernel.
+    """
+    # Plain list of ints: each cell is pushed right after the cell it was
+    # reached from, so popping yields the cell and then its parent. The path
+    # is rebuilt from parent pointers only once end is found
+    stack = [-1, start_index]
+    pop, push = stack.pop, stack.append
+    visited = bytearray(len(flat_maze))
+    parent = [-1] * len(flat_maze)
+    offsets = [width, 1, -width, -1]  # Down, right, up, left
+    nodes_explored = 0
+
+    while stack:
+        index = pop()
+        from_index = pop()
+        nodes_explored += 1
+
+        if visited[index]:
+            continue
+        visited[index] = 1
+        parent[index] = from_index
+
+        if index == end_index:
+            return parent, nodes_explored
+
+        # Shuffle directions for variety in DFS
+        random.shuffle(offsets)
+        for offset in offsets:
+            next_index = index + offset
+            if not flat_maze[next_index] and not visited[next_index]:
+                push(index)
+                push(next_index)
+    return None, nodes_explored
+
+
+def parent_chain(parent, index):
+    """Flat indices from index back to the root (-1) of a parent list"""
+    chain = []
+    while index != -1:
+        chain.append(index)
+        index = parent[index]
+    return chain
+
+
+def bidirectional_kernel(flat_maze, width, start_index, end_index):
+    """Bidirectional BFS core for find_path_bidirectional
+
+    Same grid layout as bfs_kernel; start_index must differ from end_index.
+    Each round expands one whole level of whichever side has the smaller
+    frontier, so the path found is a shortest one. Returns (path,
+    nodes_explored) with path as flat indices from start to end, or
+    (None, nodes_explored) when the searches never meet.
+    """
+    # Each side flags the cells it has seen and records the cell each one was
+    # reached from, both by flat index
+    size = len(flat_maze)
+    forward_seen, backward_seen = bytearray(size), bytearray(size)
+    forward_parent, backward_parent = [-1] * size, [-1] * size
+    forward_seen[start_index] = backward_seen[end_index] = 1
+    forward_frontier, backward_frontier = [start_index], [end_index]
+    nodes_explored = 0
+
+    while forward_frontier and backward_frontier:
+        forward = len(forward_frontier) <= len(backward_frontier)
+        if forward:
+            frontier, seen, parent, other_seen = (
+                forward_frontier, forward_seen, forward_parent, backward_seen
+            )
+        else:
+            frontier, seen, parent, other_seen = (
+                backward_frontier, backward_seen, backward_parent, forward_seen
+            )
+
+        next_frontier = []
+        append = next_frontier.append
+        for index in frontier:
+            nodes_explored += 1
+            for next_index in (index + width, index + 1, index - width, index - 1):
+                if flat_maze[next_index] or seen[next_index]:
+                    continue
+                parent[next_index] = index
+
+                # Check if we've met the other search
+                if other_seen[next_index]:
+                    # Forward chain start->meet, then backward chain meet->end
+                    path = parent_chain(forward_parent, next_index)[::-1]
+                    path += parent_chain(backward_parent, backward_parent[next_index])
+                    return path, nodes_explored
+
+                seen[next_index] = 1
+                append(next_index)
+
+        if forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    return None, nodes_explored
+
 
 class HardMazeGame:
     def __init__(self, width=35, height=35):
@@ -12,6 +282,12 @@ class HardMazeGame:
         self.height = height
         self.cell_size = 40
         self.maze = []
+        self.flat_maze = bytearray()  # self.maze flattened, indexed by y * width + x
+        # find_path results and distance_field lists (by target cell index)
+        # for the current maze; the searches depend on walls only
+        self.path_cache = {}
+        self.distance_fields = {}
+        self.cell_kinds = bytearray()  # CELL_* per cell, indexed like flat_maze
         self.player_pos = [1, 1]
         self.end_pos = [width - 2, height - 2]
         # Camera/viewport for zooming
@@ -45,6 +321,7 @@ class HardMazeGame:
         # Enemy (moving obstacle)
         self.enemy_pos = None
         self.enemy_path = []
+        self.enemy_path_index = 0  # Index of enemy_pos in enemy_path
         self.enemy_move_counter = 0
 
         # Create the main window
@@ -222,6 +499,11 @@ class HardMazeGame:
         self.maze[1][1] = 0
         self.maze[self.height - 2][self.width - 2] = 0
 
+        # Flat copy for the searches, indexed by y * width + x (non-zero = wall)
+        self.flat_maze = bytearray(cell for row in self.maze for cell in row)
+        self.path_cache = {}
+        self.distance_fields = {}
+
     def setup_difficulty_features(self):
         """Set up traps, keys, teleporters, and other difficulty features"""
         self.traps = []
@@ -231,9 +513,11 @@ class HardMazeGame:
 
         # Find all empty spaces
         empty_spaces = []
+        end_x, end_y = self.end_pos
         for y in range(1, self.height - 1):
+            row = self.maze[y]
             for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0 and [x, y] not in [[1, 1], self.end_pos]:
+                if row[x] == 0 and (x, y) != (1, 1) and (x, y) != (end_x, end_y):
                     empty_spaces.append([x, y])
 
         # Place golden keys
@@ -266,11 +550,19 @@ class HardMazeGame:
             # Create a patrol path for the enemy
             self.create_enemy_path()
 
+        self.rebuild_cell_kinds()
+
         # Set move limit based on optimal path + buffer
         optimal_path, _, _ = self.find_path([1, 1], self.end_pos, "BFS")
         if optimal_path:
             self.max_moves = len(optimal_path) * 3  # 3x the optimal moves
 
+    def rebuild_cell_kinds(self):
+        """Fold walls and traps into cell_kinds, so one lookup classifies a cell"""
+        self.cell_kinds = bytearray(self.flat_maze)  # CELL_OPEN / CELL_WALL
+        for x, y in self.traps:
+            self.cell_kinds[y * self.width + x] = CELL_TRAP
+
     def create_enemy_path(self):
         """Create a patrol path for the enemy"""
         if not self.enemy_pos:
@@ -278,6 +570,7 @@ class HardMazeGame:
 
         # Find nearby empty spaces for patrol
         self.enemy_path = [self.enemy_pos[:]]
+        self.enemy_path_index = 0
         current = self.enemy_pos[:]
 
         # Create a simple back-and-forth patrol
@@ -322,41 +615,39 @@ class HardMazeGame:
             0, min(self.height - viewport_height, py - viewport_height // 2)
         )
 
+        # Per-frame constants, looked up once instead of once per cell
+        camera_x, camera_y = self.camera_x, self.camera_y
+        cell_size = self.cell_size
+        map_revealed = self.map_revealed
+        create_rectangle = self.canvas.create_rectangle
+        if map_revealed:
+            wall_style = ("#666666", "#888888")
+            path_style = ("#e8e8e8", "#d0d0d0")
+        else:
+            wall_style = ("#444444", "#666666")
+            path_style = ("#f0f0f0", "#cccccc")
+
         # Draw the maze based on visibility mode and camera viewport
-        for y in range(
-            self.camera_y, min(self.camera_y + viewport_height, self.height)
-        ):
-            for x in range(
-                self.camera_x, min(self.camera_x + viewport_width, self.width)
-            ):
+        for y in range(camera_y, min(camera_y + viewport_height, self.height)):
+            row = self.maze[y]
+            for x in range(camera_x, min(camera_x + viewport_width, self.width)):
                 # Calculate screen coordinates
-                screen_x = (x - self.camera_x) * self.cell_size
-                screen_y = (y - self.camera_y) * self.cell_size
+                screen_x = (x - camera_x) * cell_size
+                screen_y = (y - camera_y) * cell_size
                 x1, y1 = screen_x, screen_y
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
+                x2, y2 = x1 + cell_size, y1 + cell_size
 
                 # Check if cell should be visible
                 distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
-                is_visible = self.map_revealed or distance <= vision_range
+                is_visible = map_revealed or distance <= vision_range
 
                 if is_visible:
-                    if self.maze[y][x] == 1:  # Wall
-                        color = "#444444" if not self.map_revealed else "#666666"
-                        outline = "#666666" if not self.map_revealed else "#888888"
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill=color, outline=outline
-                        )
-                    else:  # Path
-                        color = "#f0f0f0" if not self.map_revealed else "#e8e8e8"
-                        outline = "#cccccc" if not self.map_revealed else "#d0d0d0"
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill=color, outline=outline
-                        )
+                    # Wall or path
+                    color, outline = wall_style if row[x] == 1 else path_style
+                    create_rectangle(x1, y1, x2, y2, fill=color, outline=outline)
                 else:
                     # Outside vision - pure black
-                    self.canvas.create_rectangle(
-                        x1, y1, x2, y2, fill="black", outline="black"
-                    )
+                    create_rectangle(x1, y1, x2, y2, fill="black", outline="black")
 
         # Draw visible special items (or all if map revealed)
         self.draw_special_items_zoomed(px, py, vision_range)
@@ -588,18 +879,16 @@ class HardMazeGame:
         else:
             return
 
-        # Check if move is valid
-        if (
-            0 <= new_x < self.width
-            and 0 <= new_y < self.height
-            and self.maze[new_y][new_x] == 0
-        ):
+        # Check if move is valid; the maze's outer wall keeps the player's
+        # neighbors in bounds
+        cell_kind = self.cell_kinds[new_y * self.width + new_x]
+        if cell_kind != CELL_WALL:
 
             self.player_pos = [new_x, new_y]
             self.moves_count += 1
 
             # Check for trap
-            if self.player_pos in self.traps:
+            if cell_kind == CELL_TRAP:
                 messagebox.showwarning("Trap!", "You stepped on a trap! Game Over!")
                 self.reset_game()
                 return
@@ -651,12 +940,10 @@ class HardMazeGame:
 
         self.enemy_move_counter += 1
         if self.enemy_move_counter >= 5:  # Move every 5 game loops
-            current_index = (
-                self.enemy_path.index(self.enemy_pos)
-                if self.enemy_pos in self.enemy_path
-                else 0
-            )
-            next_index = (current_index + 1) % len(self.enemy_path)
+            # Advance an index into the patrol instead of searching the path
+            # for the current position with list comparisons
+            next_index = (self.enemy_path_index + 1) % len(self.enemy_path)
+            self.enemy_path_index = next_index
             self.enemy_pos = self.enemy_path[next_index][:]
             self.enemy_move_counter = 0
 
@@ -896,7 +1183,7 @@ class HardMazeGame:
 
 Algorithm Explanations:
 • BFS: Breadth-First Search - Guarantees shortest path, explores level by level
-• UCS: Uniform-Cost Search - Like BFS but for weighted graphs (same as BFS here)
+• UCS: Uniform-Cost Search - Like BFS but for weighted graphs (A*-guided here)
 • DFS: Depth-First Search - Goes deep first, may not find shortest path
 • DLS: Depth-Limited Search - DFS with depth limit to avoid infinite paths
 • IDS: Iterative Deepening Search - Combines BFS optimality with DFS memory efficiency
@@ -952,207 +1239,131 @@ Algorithm Explanations:
 
     def find_path_bfs(self, start, end):
         """Breadth-First Search - Guarantees shortest path"""
-        queue = deque([(start, [start])])
-        visited = set([tuple(start)])
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        nodes_explored = 0
-
-        while queue:
-            (x, y), path = queue.popleft()
-            nodes_explored += 1
-
-            if [x, y] == end:
-                return path, nodes_explored
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < self.width
-                    and 0 <= ny < self.height
-                    and self.maze[ny][nx] == 0
-                    and (nx, ny) not in visited
-                ):
-                    visited.add((nx, ny))
-                    queue.append(([nx, ny], path + [[nx, ny]]))
-        return None, nodes_explored
+        width = self.width
+        index = end[1] * width + end[0]
+        parent, nodes_explored = bfs_kernel(
+            self.flat_maze, width, start[1] * width + start[0], index
+        )
+        if parent is None:
+            return None, nodes_explored
+        return self.walk_parents(parent, index)[::-1], nodes_explored
 
     def find_path_ucs(self, start, end):
-        """Uniform-Cost Search - Like BFS but with priority queue for weighted graphs"""
-        import heapq
-
-        heap = [(0, start, [start])]  # (cost, position, path)
-        visited = set()
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        nodes_explored = 0
-
-        while heap:
-            cost, (x, y), path = heapq.heappop(heap)
-            nodes_explored += 1
-
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-
-            if [x, y] == end:
-                return path, nodes_explored
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < self.width
-                    and 0 <= ny < self.height
-                    and self.maze[ny][nx] == 0
-                    and (nx, ny) not in visited
-                ):
-                    new_cost = cost + 1  # Each step costs 1
-                    heapq.heappush(heap, (new_cost, [nx, ny], path + [[nx, ny]]))
-        return None, nodes_explored
+        """Uniform-Cost Search - Like BFS but with priority queue for weighted graphs
+
+        The cached distance field of end is added to the cost as an A*
+        heuristic, so only cells on shortest routes are expanded.
+        """
+        width = self.width
+        index = end[1] * width + end[0]
+        parent, nodes_explored = ucs_kernel(
+            self.flat_maze, width, start[1] * width + start[0], index,
+            self.end_distances(end),
+        )
+        if parent is None:
+            return None, nodes_explored
+        return self.walk_parents(parent, index)[::-1], nodes_explored
 
     def find_path_dfs(self, start, end):
         """Depth-First Search - May not find shortest path"""
-        stack = [(start, [start])]
-        visited = set()
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        nodes_explored = 0
-
-        while stack:
-            (x, y), path = stack.pop()
-            nodes_explored += 1
-
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-
-            if [x, y] == end:
-                return path, nodes_explored
-
-            # Shuffle directions for variety in DFS
-            random.shuffle(directions)
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < self.width
-                    and 0 <= ny < self.height
-                    and self.maze[ny][nx] == 0
-                    and (nx, ny) not in visited
-                ):
-                    stack.append(([nx, ny], path + [[nx, ny]]))
-        return None, nodes_explored
+        width = self.width
+        index = end[1] * width + end[0]
+        parent, nodes_explored = dfs_kernel(
+            self.flat_maze, width, start[1] * width + start[0], index
+        )
+        if parent is None:
+            return None, nodes_explored
+        return self.walk_parents(parent, index)[::-1], nodes_explored
 
     def find_path_dls(self, start, end, depth_limit=50):
         """Depth-Limited Search - DFS with depth limit"""
-
-        def dls_recursive(x, y, path, visited, remaining_depth):
-            if remaining_depth < 0:
-                return None, 0
-
-            if [x, y] == end:
-                return path, 1
-
-            visited.add((x, y))
-            nodes_explored = 1
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < self.width
-                    and 0 <= ny < self.height
-                    and self.maze[ny][nx] == 0
-                    and (nx, ny) not in visited
-                ):
-                    result, explored = dls_recursive(
-                        nx, ny, path + [[nx, ny]], visited.copy(), remaining_depth - 1
-                    )
-                    nodes_explored += explored
-                    if result:
-                        return result, nodes_explored
-
+        width = self.width
+        path, nodes_explored = dls_kernel(
+            self.flat_maze, width,
+            start[1] * width + start[0], end[1] * width + end[0], depth_limit,
+            self.end_distances(end),
+        )
+        if path is None:
             return None, nodes_explored
-
-        return dls_recursive(start[0], start[1], [start], set(), depth_limit)
+        return [[index % width, index // width] for index in path], nodes_explored
 
     def find_path_ids(self, start, end, max_depth=100):
         """Iterative Deepening Search - Combines benefits of BFS and DFS"""
         total_nodes_explored = 0
 
-        for depth in range(max_depth):
+        # No path can be shorter than the distance from start to end, so the
+        # shallower depths need not be tried
+        low = self.end_distances(end)[start[1] * self.width + start[0]]
+        if low >= max_depth:
+            return None, total_nodes_explored
+
+        # Double the depth limit until a path turns up (or max_depth - 1 fails)
+        depth = low
+        while True:
             result, nodes_explored = self.find_path_dls(start, end, depth)
             total_nodes_explored += nodes_explored
             if result:
-                return result, total_nodes_explored
-
-        return None, total_nodes_explored
+                break
+            if depth >= max_depth - 1:
+                return None, total_nodes_explored
+            low = depth + 1
+            depth = min(max(2 * depth, low), max_depth - 1)
+
+        # Bisect between the last failed and the first successful limit; DLS
+        # at the smallest limit that succeeds returns a shortest path
+        high = depth
+        while low < high:
+            mid = (low + high) // 2
+            shorter, nodes_explored = self.find_path_dls(start, end, mid)
+            total_nodes_explored += nodes_explored
+            if shorter:
+                result, high = shorter, mid
+            else:
+                low = mid + 1
+        return result, total_nodes_explored
+
+    def end_distances(self, end):
+        """Distance field to end, computed once per maze and target"""
+        end_index = end[1] * self.width + end[0]
+        dist = self.distance_fields.get(end_index)
+        if dist is None:
+            if len(self.distance_fields) >= DISTANCE_FIELD_CACHE_SIZE:
+                self.distance_fields.clear()
+            dist = distance_field(self.flat_maze, self.width, end_index)
+            self.distance_fields[end_index] = dist
+        return dist
+
+    def walk_parents(self, parents, index):
+        """Follow flat parent indices back to the root (-1), as [[x, y], ...]"""
+        width = self.width
+        return [[i % width, i // width] for i in parent_chain(parents, index)]
 
     def find_path_bidirectional(self, start, end):
         """Bidirectional Search - Search from both start and end"""
-        if start == end:
+        width = self.width
+        start_index = start[1] * width + start[0]
+        end_index = end[1] * width + end[0]
+        if start_index == end_index:
             return [start], 1
 
-        # Forward search from start
-        forward_queue = deque([(start, [start])])
-        forward_visited = {tuple(start): [start]}
-
-        # Backward search from end
-        backward_queue = deque([(end, [end])])
-        backward_visited = {tuple(end): [end]}
-
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        nodes_explored = 0
-
-        while forward_queue or backward_queue:
-            # Forward search step
-            if forward_queue:
-                (x, y), path = forward_queue.popleft()
-                nodes_explored += 1
-
-                # Check if we've met the backward search
-                if (x, y) in backward_visited:
-                    backward_path = backward_visited[(x, y)]
-                    # Reverse the backward path and combine
-                    full_path = path + backward_path[-2::-1]
-                    return full_path, nodes_explored
+        path, nodes_explored = bidirectional_kernel(
+            self.flat_maze, width, start_index, end_index
+        )
+        if path is None:
+            return None, nodes_explored
+        return [[index % width, index // width] for index in path], nodes_explored
 
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if (
-                        0 <= nx < self.width
-                        and 0 <= ny < self.height
-                        and self.maze[ny][nx] == 0
-                        and (nx, ny) not in forward_visited
-                    ):
-                        new_path = path + [[nx, ny]]
-                        forward_visited[(nx, ny)] = new_path
-                        forward_queue.append(([nx, ny], new_path))
-
-            # Backward search step
-            if backward_queue:
-                (x, y), path = backward_queue.popleft()
-                nodes_explored += 1
-
-                # Check if we've met the forward search
-                if (x, y) in forward_visited:
-                    forward_path = forward_visited[(x, y)]
-                    # Reverse the backward path and combine
-                    full_path = forward_path + path[-2::-1]
-                    return full_path, nodes_explored
-
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if (
-                        0 <= nx < self.width
-                        and 0 <= ny < self.height
-                        and self.maze[ny][nx] == 0
-                        and (nx, ny) not in backward_visited
-                    ):
-                        new_path = path + [[nx, ny]]
-                        backward_visited[(nx, ny)] = new_path
-                        backward_queue.append(([nx, ny], new_path))
+    def find_path(self, start, end, algorithm="BFS"):
+        """Main pathfinding function that calls the selected algorithm
 
-        return None, nodes_explored
+        Results are cached per (start, end, algorithm) until a new maze is
+        generated, so Solve, Compare and the move limit reuse searches.
+        """
+        cache_key = (start[0], start[1], end[0], end[1], algorithm)
+        cached = self.path_cache.get(cache_key)
+        if cached:
+            return cached
 
-    def find_path(self, start, end, algorithm="BFS"):
-        """Main pathfinding function that calls the selected algorithm"""
         start_time = time.time()
 
         if algorithm == "BFS":
@@ -1171,6 +1382,10 @@ Algorithm Explanations:
             result, nodes_explored = self.find_path_bfs(start, end)  # Default to BFS
 
         search_time = time.time() - start_time
+
+        if len(self.path_cache) >= PATH_CACHE_SIZE:
+            self.path_cache.clear()
+        self.path_cache[cache_key] = (result, nodes_explored, search_time)
         return result, nodes_explored, search_time
 
     def generate_new_maze(self):
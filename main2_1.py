@@ -1,9 +1,78 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
+from array import array
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import permutations
+import os
 import time
-import math
+
+# Unit steps to the four neighbors: down, right, up, left
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# All 24 orderings of DIRECTIONS, so DFS can pick a random one without shuffling
+NEIGHBOR_ORDERS = tuple(permutations(DIRECTIONS))
+
+# Neighbor order the enemy tries when laying out its patrol
+PATROL_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+# All 24 orderings of the carving steps (two cells away: down, right, up, left)
+CARVE_ORDERS = tuple(permutations([(0, 2), (2, 0), (0, -2), (-2, 0)]))
+
+# Maximum number of cached find_path results
+PATH_CACHE_SIZE = 64
+
+# Algorithms offered by the solver menu and run by Compare
+SEARCH_ALGORITHMS = ("BFS", "UCS", "DFS", "DLS", "IDS", "Bidirectional")
+
+# How often (ms) the Tk thread checks for finished background searches
+SEARCH_POLL_MS = 20
+
+# Cell display states and their (fill, outline) colors
+CELL_DARK, CELL_WALL, CELL_PATH = 0, 1, 2
+CELL_STYLES = (
+    ("black", "black"),  # Outside vision
+    ("#444444", "#666666"),  # Visible wall
+    ("#f0f0f0", "#cccccc"),  # Visible path
+)
+
+
+def bfs_kernel(flat_maze, traps_bits, width, start_index, end_index):
+    """Grid BFS core for find_path_bfs
+
+    flat_maze and traps_bits are flat bytearrays indexed by y * width + x
+    (non-zero = blocked); the maze's outer wall border keeps every neighbor
+    offset in bounds. Returns (parent, nodes_explored) where parent maps a
+    flat cell index to its parent's flat index, or (None, nodes_explored)
+    when end cannot be reached.
+    """
+    visited = bytearray(len(flat_maze))
+    parent = [-1] * len(flat_maze)
+    visited[start_index] = 1
+    queue = deque([start_index])
+    popleft, append = queue.popleft, queue.append
+    offsets = (width, 1, -width, -1)
+    nodes_explored = 0
+
+    while queue:
+        index = popleft()
+        nodes_explored += 1
+
+        if index == end_index:
+            return parent, nodes_explored
+
+        for offset in offsets:
+            next_index = index + offset
+            if (
+                not flat_maze[next_index]
+                and not traps_bits[next_index]
+                and not visited[next_index]
+            ):
+                visited[next_index] = 1
+                parent[next_index] = index
+                append(next_index)
+    return None, nodes_explored
 
 
 class HardMazeGame:
@@ -12,6 +81,7 @@ class HardMazeGame:
         self.height = height
         self.cell_size = 18
         self.maze = []
+        self.flat_maze = bytearray()  # self.maze flattened, indexed by y * width + x
         self.player_pos = [1, 1]
         self.end_pos = [width - 2, height - 2]
 
@@ -26,24 +96,48 @@ class HardMazeGame:
         self.flashlight_start = None
 
         # Traps and hazards
-        self.traps = []
+        self.traps = set()  # (x, y) tuples
+        self.traps_bits = bytearray()  # Flat trap flags, indexed like flat_maze
         self.moving_walls = []
         self.wall_move_timer = 0
         self.teleporters = []
+        self.teleport_map = {}  # (x, y) -> paired teleporter (x, y)
 
         # Power-ups
-        self.keys = []  # Golden keys to collect
+        self.keys = set()  # Golden keys to collect, (x, y) tuples
         self.keys_collected = 0
         self.required_keys = 3
 
         # Enemy (moving obstacle)
         self.enemy_pos = None
         self.enemy_path = []
+        self.enemy_path_idx = 0  # Index of enemy_pos in enemy_path
+
+        # find_path results for the current maze and traps
+        self.path_cache = {}
+        # Worker threads for Solve/Compare searches, keeping the UI responsive
+        self.search_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.closing = False  # Set once the window is closed
+
+        # Last (text, color) set on each info label, to skip no-op updates
+        self.label_states = {}
+        # Squared vision radius used by the last draw_maze
+        self.vision_range_sq = self.visibility_radius * self.visibility_radius
+        # (dx, dy) offsets inside the vision disk, per radius (normal, flashlight)
+        self.disk_offsets = {
+            r: [
+                (dx, dy)
+                for dy in range(-r, r + 1) for dx in range(-r, r + 1)
+                if dx * dx + dy * dy <= r * r
+            ]
+            for r in (self.visibility_radius, 8)
+        }
         self.enemy_move_counter = 0
 
         # Create the main window
         self.root = tk.Tk()
         self.root.title("HARD Maze Game - Survival Mode")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.root.resizable(False, False)
 
         # Create canvas
@@ -118,8 +212,7 @@ class HardMazeGame:
             side=tk.LEFT, padx=(10, 2)
         )
         self.solver_var = tk.StringVar(value="BFS")
-        solver_options = ["BFS", "UCS", "DFS", "DLS", "IDS", "Bidirectional"]
-        self.solver_menu = tk.OptionMenu(button_frame, self.solver_var, *solver_options)
+        self.solver_menu = tk.OptionMenu(button_frame, self.solver_var, *SEARCH_ALGORITHMS)
         self.solver_menu.config(font=("Arial", 8))
         self.solver_menu.pack(side=tk.LEFT, padx=2)
 
@@ -141,6 +234,7 @@ class HardMazeGame:
         self.root.focus_set()
 
         # Generate initial maze
+        self.create_canvas_items()
         self.generate_maze()
         self.setup_difficulty_features()
         self.start_time = time.time()
@@ -150,104 +244,125 @@ class HardMazeGame:
 
     def generate_maze(self):
         """Generate a more complex maze with multiple paths and dead ends"""
-        self.maze = [[1 for _ in range(self.width)] for _ in range(self.height)]
+        width, height = self.width, self.height
 
-        # Create main path using recursive backtracking
-        stack = []
-        start_x, start_y = 1, 1
-        self.maze[start_y][start_x] = 0
-        stack.append((start_x, start_y))
+        # Carve in a flat grid indexed by y * width + x: walls (1) and paths (0)
+        grid = bytearray(b"\x01") * (width * height)
 
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
+        # Create main path using recursive backtracking over flat indices
+        start = width + 1
+        grid[start] = 0
+        stack = array("i", [start])
+        randrange = random.randrange
 
         while stack:
-            current_x, current_y = stack[-1]
-            neighbors = []
+            index = stack[-1]
+            current_y, current_x = divmod(index, width)
 
-            for dx, dy in directions:
+            # Trying directions in a random order and taking the first open
+            # one picks uniformly among the unvisited neighbors
+            for dx, dy in CARVE_ORDERS[randrange(len(CARVE_ORDERS))]:
                 nx, ny = current_x + dx, current_y + dy
-                if (
-                    0 < nx < self.width - 1
-                    and 0 < ny < self.height - 1
-                    and self.maze[ny][nx] == 1
-                ):
-                    neighbors.append((nx, ny, dx // 2, dy // 2))
-
-            if neighbors:
-                nx, ny, wall_x, wall_y = random.choice(neighbors)
-                self.maze[current_y + wall_y][current_x + wall_x] = 0
-                self.maze[ny][nx] = 0
-                stack.append((nx, ny))
+                if 0 < nx < width - 1 and 0 < ny < height - 1:
+                    step = dy * width + dx
+                    if grid[index + step] == 1:
+                        grid[index + step // 2] = 0  # Wall in between
+                        grid[index + step] = 0
+                        stack.append(index + step)
+                        break
             else:
                 stack.pop()
 
         # Add extra connections to create loops (makes it harder)
-        for _ in range(self.width // 2):
-            x = random.randrange(1, self.width - 1, 2)
-            y = random.randrange(1, self.height - 1, 2)
-            if self.maze[y][x] == 0:
+        for _ in range(width // 2):
+            x = random.randrange(1, width - 1, 2)
+            y = random.randrange(1, height - 1, 2)
+            if grid[y * width + x] == 0:
                 # Try to break a wall to create a loop
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                for dx, dy in DIRECTIONS:
                     nx, ny = x + dx, y + dy
                     if (
-                        0 < nx < self.width - 1
-                        and 0 < ny < self.height - 1
-                        and self.maze[ny][nx] == 1
+                        0 < nx < width - 1
+                        and 0 < ny < height - 1
+                        and grid[ny * width + nx] == 1
                         and random.random() < 0.3
                     ):
-                        self.maze[ny][nx] = 0
+                        grid[ny * width + nx] = 0
                         break
 
         # Ensure start and end are clear
-        self.maze[1][1] = 0
-        self.maze[self.height - 2][self.width - 2] = 0
+        grid[start] = 0
+        grid[(height - 2) * width + width - 2] = 0
+
+        # The flat grid feeds the searches; rows are split off for drawing
+        self.flat_maze = grid
+        self.maze = [grid[y * width:(y + 1) * width] for y in range(height)]
 
     def setup_difficulty_features(self):
         """Set up traps, keys, teleporters, and other difficulty features"""
-        self.traps = []
-        self.keys = []
         self.teleporters = []
+        self.teleport_map = {}
         self.moving_walls = []
+        self.path_cache = {}  # Search results depend on the maze and traps
 
-        # Find all empty spaces
+        # Find all empty spaces as flat indices; the wall border means the
+        # whole buffer can be scanned with bytearray.find
+        width = self.width
+        excluded = (width + 1, self.end_pos[1] * width + self.end_pos[0])
         empty_spaces = []
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0 and [x, y] not in [[1, 1], self.end_pos]:
-                    empty_spaces.append([x, y])
+        index = self.flat_maze.find(0)
+        while index != -1:
+            if index not in excluded:
+                empty_spaces.append(index)
+            index = self.flat_maze.find(0, index + 1)
+
+        # Work out how many of each item fit, then draw them all at once
+        num_keys = min(self.required_keys, len(empty_spaces))
+        remaining = len(empty_spaces) - num_keys
+        num_traps = min(8, remaining // 10)  # Invisible death squares
+        remaining -= num_traps
+        num_teleporters = 4 if remaining >= 4 else 0  # 2 pairs of teleporters
+        remaining -= num_teleporters
+        num_enemies = 1 if remaining else 0
+
+        picks = [
+            [index % width, index // width]
+            for index in random.sample(
+                empty_spaces, num_keys + num_traps + num_teleporters + num_enemies
+            )
+        ]
 
         # Place golden keys
-        for _ in range(self.required_keys):
-            if empty_spaces:
-                pos = random.choice(empty_spaces)
-                self.keys.append(pos)
-                empty_spaces.remove(pos)
-
-        # Place traps (invisible death squares)
-        num_traps = min(8, len(empty_spaces) // 10)
-        for _ in range(num_traps):
-            if empty_spaces:
-                pos = random.choice(empty_spaces)
-                self.traps.append(pos)
-                empty_spaces.remove(pos)
+        self.keys = {tuple(pos) for pos in picks[:num_keys]}
+        del picks[:num_keys]
+
+        # Place traps
+        self.traps = {tuple(pos) for pos in picks[:num_traps]}
+        del picks[:num_traps]
+
+        # Flat trap flags used by the BFS kernel
+        self.traps_bits = bytearray(self.width * self.height)
+        for tx, ty in self.traps:
+            self.traps_bits[ty * self.width + tx] = 1
 
         # Place teleporter pairs
-        if len(empty_spaces) >= 4:
-            for _ in range(2):  # 2 pairs of teleporters
-                pos1 = random.choice(empty_spaces)
-                empty_spaces.remove(pos1)
-                pos2 = random.choice(empty_spaces)
-                empty_spaces.remove(pos2)
-                self.teleporters.append((pos1, pos2))
+        for i in range(0, num_teleporters, 2):
+            pos1, pos2 = picks[i], picks[i + 1]
+            self.teleporters.append((pos1, pos2))
+            self.teleport_map[tuple(pos1)] = tuple(pos2)
+            self.teleport_map[tuple(pos2)] = tuple(pos1)
+        del picks[:num_teleporters]
 
         # Set up enemy
-        if empty_spaces:
-            self.enemy_pos = random.choice(empty_spaces)
+        if picks:
+            self.enemy_pos = picks[0]
             # Create a patrol path for the enemy
             self.create_enemy_path()
 
+        self.create_sprites()
+
         # Set move limit based on optimal path + buffer
-        optimal_path, _, _ = self.find_path([1, 1], self.end_pos, "BFS")
+        optimal_path, _, _ = self.find_path([1, 1], self.end_pos, "Bidirectional")
         if optimal_path:
             self.max_moves = len(optimal_path) * 3  # 3x the optimal moves
 
@@ -258,11 +373,12 @@ class HardMazeGame:
 
         # Find nearby empty spaces for patrol
         self.enemy_path = [self.enemy_pos[:]]
+        self.enemy_path_idx = 0
         current = self.enemy_pos[:]
 
         # Create a simple back-and-forth patrol
         for _ in range(6):
-            for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
+            for dx, dy in PATROL_DIRECTIONS:
                 nx, ny = current[0] + dx, current[1] + dy
                 if (
                     0 <= nx < self.width
@@ -274,148 +390,245 @@ class HardMazeGame:
                     current = [nx, ny]
                     break
 
-    def draw_maze(self):
-        """Draw the maze with limited visibility"""
-        self.canvas.delete("all")
-
-        px, py = self.player_pos
-        vision_range = self.visibility_radius
+    def create_canvas_items(self):
+        """Create the persistent cell rectangles and the player item"""
+        cs = self.cell_size
+        self.cell_ids = [
+            [
+                self.canvas.create_rectangle(
+                    x * cs, y * cs, x * cs + cs, y * cs + cs,
+                    fill="black", outline="black",
+                )
+                for x in range(self.width)
+            ]
+            for y in range(self.height)
+        ]
+        # Style each cell currently has on screen, an index into CELL_STYLES
+        self.cell_states = [bytearray(self.width) for _ in range(self.height)]
+        self.lit_cells = set()  # (x, y) cells drawn inside the vision disk
+        self.sprites = {}
+        self.sprite_images = {}  # (inset, shape, fill, outline) -> PhotoImage
+        self.enemy_sprite = None
+        self.player_id = self.canvas.create_oval(
+            0, 0, 0, 0, fill="blue", outline="darkblue", tags="player"
+        )
 
-        # Extend vision if flashlight is active
-        if self.has_flashlight and self.flashlight_start:
-            elapsed = time.time() - self.flashlight_start
-            if elapsed < self.flashlight_duration:
-                vision_range = 8
+        # Non-blocking on-canvas message used instead of info dialogs
+        self.toast_id = self.canvas.create_text(
+            self.width * cs // 2, cs, text="", fill="yellow",
+            font=("Arial", 12, "bold"), state="hidden",
+        )
+        self.toast_hide_job = None
+
+    def show_toast(self, message, duration=1200):
+        """Show a short message over the maze without pausing the game"""
+        self.canvas.itemconfigure(self.toast_id, text=message, state="normal")
+        self.canvas.tag_raise(self.toast_id)
+        if self.toast_hide_job:
+            self.root.after_cancel(self.toast_hide_job)
+        self.toast_hide_job = self.root.after(duration, self.hide_toast)
+
+    def hide_toast(self):
+        """Hide the on-canvas message"""
+        self.canvas.itemconfigure(self.toast_id, state="hidden")
+        self.toast_hide_job = None
+
+    def sprite_image(self, inset, shape, fill, outline):
+        """Return the cached PhotoImage for a sprite's background shape
+
+        Each shape is rendered once per game and shared by every sprite using
+        it; pixels outside the shape stay transparent.
+        """
+        spec = (inset, shape, fill, outline)
+        image = self.sprite_images.get(spec)
+        if image is None:
+            size = self.cell_size - 2 * inset
+            image = tk.PhotoImage(width=size, height=size)
+            if shape == "oval":
+                # Outline-colored disk with a fill-colored disk one pixel inside
+                for color, ring in ((outline, 0), (fill, 1)):
+                    radius = size / 2 - ring
+                    for row in range(ring, size - ring):
+                        dy = row + 0.5 - size / 2
+                        half = max(radius * radius - dy * dy, 0) ** 0.5
+                        left, right = round(size / 2 - half), round(size / 2 + half)
+                        if left < right:
+                            image.put(color, to=(left, row, right, row + 1))
             else:
-                self.has_flashlight = False
-                self.flashlight_start = None
-
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate distance from player
-                distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
-
-                x1, y1 = x * self.cell_size, y * self.cell_size
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-
-                if distance <= vision_range:
-                    if self.maze[y][x] == 1:  # Wall
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill="#444444", outline="#666666"
-                        )
-                    else:  # Path
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill="#f0f0f0", outline="#cccccc"
-                        )
-                else:
-                    # Outside vision - pure black
-                    self.canvas.create_rectangle(
-                        x1, y1, x2, y2, fill="black", outline="black"
-                    )
+                image.put(outline, to=(0, 0, size, size))
+                image.put(fill, to=(1, 1, size - 1, size - 1))
+            self.sprite_images[spec] = image
+        return image
+
+    def create_sprite(self, x, y, inset, shape, fill, outline, text, font, text_fill="black"):
+        """Create a hidden shape image + symbol pair for an item at (x, y)"""
+        cs = self.cell_size
+        center_x, center_y = x * cs + cs // 2, y * cs + cs // 2
+        ids = (
+            self.canvas.create_image(
+                x * cs + inset, y * cs + inset, anchor="nw",
+                image=self.sprite_image(inset, shape, fill, outline),
+                state="hidden", tags="sprite",
+            ),
+            self.canvas.create_text(
+                center_x, center_y, text=text, fill=text_fill,
+                font=font, state="hidden", tags="sprite",
+            ),
+        )
+        return [ids, False]  # [item ids, currently visible]
 
-        # Draw visible special items
-        px, py = self.player_pos
+    def create_sprites(self):
+        """Create hidden canvas items for keys, teleporters, enemy, start and exit"""
+        self.canvas.delete("sprite")
+        self.sprites = {}
 
-        # Draw keys
         for kx, ky in self.keys:
-            if math.sqrt((kx - px) ** 2 + (ky - py) ** 2) <= vision_range:
-                x1, y1 = kx * self.cell_size + 4, ky * self.cell_size + 4
-                x2, y2 = x1 + self.cell_size - 8, y1 + self.cell_size - 8
-                self.canvas.create_oval(x1, y1, x2, y2, fill="gold", outline="orange")
-                # Key symbol
-                self.canvas.create_text(
-                    kx * self.cell_size + self.cell_size // 2,
-                    ky * self.cell_size + self.cell_size // 2,
-                    text="🗝",
-                    font=("Arial", 8),
-                )
+            self.sprites[("key", kx, ky)] = self.create_sprite(
+                kx, ky, 4, "oval", "gold", "orange", "🗝", ("Arial", 8)
+            )
 
-        # Draw teleporters
         for pos1, pos2 in self.teleporters:
             for tx, ty in [pos1, pos2]:
-                if math.sqrt((tx - px) ** 2 + (ty - py) ** 2) <= vision_range:
-                    x1, y1 = tx * self.cell_size + 2, ty * self.cell_size + 2
-                    x2, y2 = x1 + self.cell_size - 4, y1 + self.cell_size - 4
-                    self.canvas.create_oval(
-                        x1, y1, x2, y2, fill="purple", outline="magenta"
-                    )
-                    self.canvas.create_text(
-                        tx * self.cell_size + self.cell_size // 2,
-                        ty * self.cell_size + self.cell_size // 2,
-                        text="◉",
-                        fill="white",
-                        font=("Arial", 8),
-                    )
+                self.sprites[("teleporter", tx, ty)] = self.create_sprite(
+                    tx, ty, 2, "oval", "purple", "magenta", "◉", ("Arial", 8), "white"
+                )
 
-        # Draw enemy
+        # The enemy moves, so it is kept apart from the static sprites
+        self.enemy_sprite = None
         if self.enemy_pos:
             ex, ey = self.enemy_pos
-            if math.sqrt((ex - px) ** 2 + (ey - py) ** 2) <= vision_range:
-                x1, y1 = ex * self.cell_size + 1, ey * self.cell_size + 1
-                x2, y2 = x1 + self.cell_size - 2, y1 + self.cell_size - 2
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="red", outline="darkred"
-                )
-                self.canvas.create_text(
-                    ex * self.cell_size + self.cell_size // 2,
-                    ey * self.cell_size + self.cell_size // 2,
-                    text="👹",
-                    font=("Arial", 10),
-                )
-
-        # Draw start position (only if visible)
-        if math.sqrt((1 - px) ** 2 + (1 - py) ** 2) <= vision_range:
-            x1, y1 = 1 * self.cell_size + 2, 1 * self.cell_size + 2
-            x2, y2 = x1 + self.cell_size - 4, y1 + self.cell_size - 4
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2, fill="lightgreen", outline="green"
+            self.enemy_sprite = self.create_sprite(
+                ex, ey, 1, "rect", "red", "darkred", "👹", ("Arial", 10)
             )
+            self.enemy_sprite.append([ex, ey])  # Position the items are drawn at
+
+        self.sprites[("start", 1, 1)] = [
+            (
+                self.canvas.create_image(
+                    self.cell_size + 2, self.cell_size + 2, anchor="nw",
+                    image=self.sprite_image(2, "rect", "lightgreen", "green"),
+                    state="hidden", tags="sprite",
+                ),
+            ),
+            False,
+        ]
 
-        # Draw end position (only if visible and all keys collected)
         end_x, end_y = self.end_pos
-        if math.sqrt((end_x - px) ** 2 + (end_y - py) ** 2) <= vision_range:
-            x1, y1 = end_x * self.cell_size + 2, end_y * self.cell_size + 2
-            x2, y2 = x1 + self.cell_size - 4, y1 + self.cell_size - 4
-            if self.keys_collected >= self.required_keys:
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="lightcoral", outline="red"
-                )
-                self.canvas.create_text(
-                    end_x * self.cell_size + self.cell_size // 2,
-                    end_y * self.cell_size + self.cell_size // 2,
-                    text="🚪",
-                    font=("Arial", 12),
-                )
+        self.sprites[("exit_open", end_x, end_y)] = self.create_sprite(
+            end_x, end_y, 2, "rect", "lightcoral", "red", "🚪", ("Arial", 12)
+        )
+        self.sprites[("exit_locked", end_x, end_y)] = self.create_sprite(
+            end_x, end_y, 2, "rect", "gray", "darkgray", "🔒", ("Arial", 12)
+        )
+
+        self.canvas.tag_raise(self.player_id)
+
+    def set_sprite_visible(self, sprite, visible):
+        """Show or hide a sprite's items if its visibility changed"""
+        if sprite[1] != visible:
+            state = "normal" if visible else "hidden"
+            for item in sprite[0]:
+                self.canvas.itemconfigure(item, state=state)
+            sprite[1] = visible
+
+    def remove_sprite(self, key):
+        """Delete a static sprite's canvas items"""
+        sprite = self.sprites.pop(key, None)
+        if sprite:
+            self.canvas.delete(*sprite[0])
+
+    def draw_maze(self):
+        """Draw the maze with limited visibility"""
+        self.canvas.delete("solution")
+
+        px, py = self.player_pos
+        vision_range = self.visibility_radius
+
+        # Extend vision if flashlight is active
+        if self.has_flashlight and self.flashlight_start:
+            elapsed = time.time() - self.flashlight_start
+            if elapsed < self.flashlight_duration:
+                vision_range = 8
             else:
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="gray", outline="darkgray"
-                )
-                self.canvas.create_text(
-                    end_x * self.cell_size + self.cell_size // 2,
-                    end_y * self.cell_size + self.cell_size // 2,
-                    text="🔒",
-                    font=("Arial", 12),
-                )
+                self.has_flashlight = False
+                self.flashlight_start = None
+
+        # Compare squared distances against the squared radius; no sqrt needed
+        vision_range_sq = vision_range * vision_range
+
+        # Only cells inside the vision disk are lit; everything else is dark
+        lit_cells = set()
+        width, height = self.width, self.height
+        for dx, dy in self.disk_offsets[vision_range]:
+            x, y = px + dx, py + dy
+            if 0 <= x < width and 0 <= y < height:
+                lit_cells.add((x, y))
+
+        # Darken cells that were lit last draw but fell out of the disk
+        fill, outline = CELL_STYLES[CELL_DARK]
+        for x, y in self.lit_cells - lit_cells:
+            self.canvas.itemconfig(self.cell_ids[y][x], fill=fill, outline=outline)
+            self.cell_states[y][x] = CELL_DARK
+
+        # Recolor only the lit cells whose style changed since the last draw
+        for x, y in lit_cells:
+            state = CELL_WALL if self.maze[y][x] == 1 else CELL_PATH
+            states = self.cell_states[y]
+            if states[x] != state:
+                fill, outline = CELL_STYLES[state]
+                self.canvas.itemconfig(self.cell_ids[y][x], fill=fill, outline=outline)
+                states[x] = state
+        self.lit_cells = lit_cells
+
+        # Show visible special items, hide the rest
+        exit_open = self.keys_collected >= self.required_keys
+        for (kind, sx, sy), sprite in self.sprites.items():
+            visible = (sx - px) * (sx - px) + (sy - py) * (sy - py) <= vision_range_sq
+            if kind == "exit_open":
+                visible = visible and exit_open
+            elif kind == "exit_locked":
+                visible = visible and not exit_open
+            self.set_sprite_visible(sprite, visible)
+
+        # Enemy (also redrawn on its own as it patrols)
+        self.vision_range_sq = vision_range_sq
+        self.draw_enemy()
 
         # Draw player
         self.draw_player()
 
+    def draw_enemy(self):
+        """Move the enemy's items to its current cell and update visibility"""
+        if not self.enemy_sprite:
+            return
+
+        px, py = self.player_pos
+        ex, ey = self.enemy_pos
+        drawn = self.enemy_sprite[2]
+        if drawn != [ex, ey]:
+            shift_x = (ex - drawn[0]) * self.cell_size
+            shift_y = (ey - drawn[1]) * self.cell_size
+            for item in self.enemy_sprite[0]:
+                self.canvas.move(item, shift_x, shift_y)
+            self.enemy_sprite[2] = [ex, ey]
+        self.set_sprite_visible(
+            self.enemy_sprite,
+            (ex - px) * (ex - px) + (ey - py) * (ey - py) <= self.vision_range_sq,
+        )
+
     def draw_player(self):
-        """Draw player at current position"""
-        self.canvas.delete("player")
+        """Move the player item to the current position"""
         px, py = self.player_pos
         center_x = px * self.cell_size + self.cell_size // 2
         center_y = py * self.cell_size + self.cell_size // 2
         radius = self.cell_size // 3
 
-        self.canvas.create_oval(
+        self.canvas.coords(
+            self.player_id,
             center_x - radius,
             center_y - radius,
             center_x + radius,
             center_y + radius,
-            fill="blue",
-            outline="darkblue",
-            tags="player",
         )
 
     def on_key_press(self, event):
@@ -465,7 +678,7 @@ class HardMazeGame:
             self.moves_count += 1
 
             # Check for trap
-            if self.player_pos in self.traps:
+            if (new_x, new_y) in self.traps:
                 messagebox.showwarning("Trap!", "You stepped on a trap! Game Over!")
                 self.reset_game()
                 return
@@ -477,24 +690,19 @@ class HardMazeGame:
                 return
 
             # Check for key collection
-            if self.player_pos in self.keys:
-                self.keys.remove(self.player_pos)
+            if (new_x, new_y) in self.keys:
+                self.keys.remove((new_x, new_y))
+                self.remove_sprite(("key", new_x, new_y))
                 self.keys_collected += 1
-                messagebox.showinfo(
-                    "Key Found!",
-                    f"You found a key! ({self.keys_collected}/{self.required_keys})",
+                self.show_toast(
+                    f"You found a key! ({self.keys_collected}/{self.required_keys})"
                 )
 
             # Check for teleporter
-            for pos1, pos2 in self.teleporters:
-                if self.player_pos == pos1:
-                    self.player_pos = pos2[:]
-                    messagebox.showinfo("Teleported!", "You've been teleported!")
-                    break
-                elif self.player_pos == pos2:
-                    self.player_pos = pos1[:]
-                    messagebox.showinfo("Teleported!", "You've been teleported!")
-                    break
+            destination = self.teleport_map.get((new_x, new_y))
+            if destination:
+                self.player_pos = list(destination)
+                self.show_toast("You've been teleported!")
 
             self.draw_maze()
 
@@ -517,14 +725,22 @@ class HardMazeGame:
 
         self.enemy_move_counter += 1
         if self.enemy_move_counter >= 5:  # Move every 5 game loops
-            current_index = (
-                self.enemy_path.index(self.enemy_pos)
-                if self.enemy_pos in self.enemy_path
-                else 0
-            )
-            next_index = (current_index + 1) % len(self.enemy_path)
-            self.enemy_pos = self.enemy_path[next_index][:]
+            self.enemy_path_idx = (self.enemy_path_idx + 1) % len(self.enemy_path)
+            self.enemy_pos = self.enemy_path[self.enemy_path_idx][:]
             self.enemy_move_counter = 0
+            # Only the enemy's own items change; no full redraw needed
+            self.draw_enemy()
+
+    def set_label(self, label, text, fg=None):
+        """Reconfigure a label only when its text or color actually changed"""
+        shown = (text, fg)
+        if self.label_states.get(label) == shown:
+            return
+        if fg is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, fg=fg)
+        self.label_states[label] = shown
 
     def update_info(self):
         """Update the information display"""
@@ -533,7 +749,7 @@ class HardMazeGame:
             remaining = max(0, self.time_limit - elapsed)
             minutes = int(remaining // 60)
             seconds = int(remaining % 60)
-            self.time_label.config(text=f"Time: {minutes}:{seconds:02d}")
+            self.set_label(self.time_label, f"Time: {minutes}:{seconds:02d}")
 
             if remaining <= 0:
                 messagebox.showwarning("Time's Up!", "You ran out of time! Game Over!")
@@ -543,7 +759,7 @@ class HardMazeGame:
         moves_text = f"Moves: {self.moves_count}"
         if self.max_moves:
             moves_text += f"/{self.max_moves}"
-        self.moves_label.config(text=moves_text)
+        self.set_label(self.moves_label, moves_text)
 
         if self.max_moves and self.moves_count >= self.max_moves:
             messagebox.showwarning(
@@ -552,23 +768,24 @@ class HardMazeGame:
             self.reset_game()
             return
 
-        self.keys_label.config(text=f"Keys: {self.keys_collected}/{self.required_keys}")
+        self.set_label(
+            self.keys_label, f"Keys: {self.keys_collected}/{self.required_keys}"
+        )
 
         # Flashlight status
         if self.has_flashlight and self.flashlight_start:
             remaining_flash = max(
                 0, self.flashlight_duration - (time.time() - self.flashlight_start)
             )
-            self.flashlight_label.config(
-                text=f"F: Flash {remaining_flash:.0f}s", fg="yellow"
+            self.set_label(
+                self.flashlight_label, f"F: Flash {remaining_flash:.0f}s", "yellow"
             )
         else:
-            self.flashlight_label.config(text="F: Flashlight", fg="gray")
+            self.set_label(self.flashlight_label, "F: Flashlight", "gray")
 
     def show_solution(self):
         """Show the solution path using selected algorithm"""
         algorithm = self.solver_var.get()
-        start_pos = [1, 1]
 
         # If player needs keys, find path to nearest key first
         if self.keys_collected < self.required_keys and self.keys:
@@ -577,10 +794,20 @@ class HardMazeGame:
                 key=lambda k: abs(k[0] - self.player_pos[0])
                 + abs(k[1] - self.player_pos[1]),
             )
-            path_result = self.find_path(self.player_pos, target, algorithm)
+            target_type = "nearest key"
         else:
-            path_result = self.find_path(self.player_pos, self.end_pos, algorithm)
+            target = self.end_pos
+            target_type = "exit"
 
+        self.run_searches(
+            self.player_pos[:], target, [algorithm],
+            lambda futures: self.draw_solution(
+                algorithm, target_type, futures[0].result()
+            ),
+        )
+
+    def draw_solution(self, algorithm, target_type, path_result):
+        """Draw a finished show_solution search and report its performance"""
         if len(path_result) == 3:
             path, nodes_explored, search_time = path_result
         else:
@@ -609,11 +836,6 @@ class HardMazeGame:
                 )
 
             # Show algorithm performance
-            target_type = (
-                "nearest key"
-                if (self.keys_collected < self.required_keys and self.keys)
-                else "exit"
-            )
             messagebox.showinfo(
                 "Solution Found",
                 f"Algorithm: {algorithm}\n"
@@ -627,7 +849,6 @@ class HardMazeGame:
 
     def compare_algorithms(self):
         """Compare all search algorithms"""
-        algorithms = ["BFS", "UCS", "DFS", "DLS", "IDS", "Bidirectional"]
         start_pos = self.player_pos[:]
         end_pos = self.end_pos[:]
 
@@ -638,11 +859,15 @@ class HardMazeGame:
                 key=lambda k: abs(k[0] - start_pos[0]) + abs(k[1] - start_pos[1]),
             )
 
+        self.run_searches(start_pos, end_pos, SEARCH_ALGORITHMS, self.show_comparison)
+
+    def show_comparison(self, futures):
+        """Show the finished compare_algorithms searches in a new window"""
         results = []
 
-        for algorithm in algorithms:
+        for algorithm, future in zip(SEARCH_ALGORITHMS, futures):
             try:
-                path_result = self.find_path(start_pos, end_pos, algorithm)
+                path_result = future.result()
                 if len(path_result) == 3:
                     path, nodes_explored, search_time = path_result
                 else:
@@ -732,133 +957,150 @@ Algorithm Explanations:
 
         self.root.after(200, self.game_loop)  # Run every 200ms
 
-    def is_safe_cell(self, x, y):
-        """Check if a cell is safe to move to (not a wall, trap, or enemy)"""
-        # Check bounds
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
+    def run_searches(self, start, end, algorithms, callback):
+        """Run each algorithm's search on the search pool, unless already cached
+
+        Once all are done, callback(futures) is called on the Tk thread with
+        one future per algorithm, in order. Workers never touch path_cache:
+        results are stored from the Tk thread, and only if the maze and
+        traps did not change meanwhile. A new maze or trap layout always
+        replaces path_cache within the same Tk callback that swaps flat_maze
+        and traps_bits, so a search that could have read old or half-built
+        grids is always dropped.
+        """
+        cache = self.path_cache
+        cache_keys = [(start[0], start[1], end[0], end[1], algorithm) for algorithm in algorithms]
+        futures = []
+        for cache_key, algorithm in zip(cache_keys, algorithms):
+            cached = cache.get(cache_key)
+            if cached:
+                future = Future()
+                future.set_result(cached)
+            else:
+                future = self.search_pool.submit(self.search, start, end, algorithm)
+            futures.append(future)
 
-        # Check if it's a wall
-        if self.maze[y][x] == 1:
-            return False
+        def poll():
+            if self.path_cache is not cache:
+                messagebox.showinfo(
+                    "Search Cancelled",
+                    "The maze changed before the search finished. Please try again.",
+                )
+                return
+            if all(future.done() for future in futures):
+                for cache_key, future in zip(cache_keys, futures):
+                    if future.exception() is None:
+                        self.store_path(cache_key, future.result())
+                callback(futures)
+            else:
+                self.root.after(SEARCH_POLL_MS, poll)
 
-        # Check if it's a trap
-        if [x, y] in self.traps:
-            return False
+        self.root.after(SEARCH_POLL_MS, poll)
 
-        # Check if it's the enemy position (optional - you might want to allow this)
-        # if [x, y] == self.enemy_pos:
-        #     return False
+    def build_path(self, parents, index):
+        """Walk flat parent indices back from index and return the [[x, y], ...] path
 
-        return True
+        parents maps a flat cell index to its parent's index, -1 for the root.
+        """
+        width = self.width
+        path = []
+        while index != -1:
+            path.append([index % width, index // width])
+            index = parents[index]
+        path.reverse()
+        return path
 
     def find_path_bfs(self, start, end):
         """Breadth-First Search - Guarantees shortest path, avoiding traps"""
-        queue = deque([(start, [start])])
-        visited = set([tuple(start)])
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        nodes_explored = 0
-
-        while queue:
-            (x, y), path = queue.popleft()
-            nodes_explored += 1
-
-            if [x, y] == end:
-                return path, nodes_explored
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append(([nx, ny], path + [[nx, ny]]))
-        return None, nodes_explored
+        index = end[1] * self.width + end[0]
+        parent, nodes_explored = bfs_kernel(
+            self.flat_maze, self.traps_bits, self.width,
+            start[1] * self.width + start[0], index
+        )
+        if parent is None:
+            return None, nodes_explored
+        return self.build_path(parent, index), nodes_explored
 
     def find_path_ucs(self, start, end):
-        """Uniform-Cost Search - Like BFS but with priority queue for weighted graphs, avoiding traps"""
-        import heapq
-
-        heap = [(0, start, [start])]  # (cost, position, path)
-        visited = set()
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        nodes_explored = 0
-
-        while heap:
-            cost, (x, y), path = heapq.heappop(heap)
-            nodes_explored += 1
-
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-
-            if [x, y] == end:
-                return path, nodes_explored
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    new_cost = cost + 1  # Each step costs 1
-                    heapq.heappush(heap, (new_cost, [nx, ny], path + [[nx, ny]]))
-        return None, nodes_explored
+        """Uniform-Cost Search - Every step costs 1 here, so UCS expands cells
+        in exactly BFS order; it runs the BFS kernel without heap overhead.
+        Reintroduce a priority queue if steps ever get different costs.
+        """
+        return self.find_path_bfs(start, end)
 
     def find_path_dfs(self, start, end):
         """Depth-First Search - May not find shortest path, avoiding traps"""
-        stack = [(start, [start])]
-        visited = set()
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        width = self.width
+        flat_maze, traps_bits = self.flat_maze, self.traps_bits
+        end_index = end[1] * width + end[0]
+        visited = bytearray(len(flat_maze))
+        parents = [-1] * len(flat_maze)
+        stack = [(start[1] * width + start[0], -1)]  # (cell, parent it was pushed from)
         nodes_explored = 0
 
         while stack:
-            (x, y), path = stack.pop()
+            index, parent = stack.pop()
             nodes_explored += 1
 
-            if (x, y) in visited:
+            # A cell is visited the first time it is popped
+            if visited[index]:
                 continue
-            visited.add((x, y))
+            visited[index] = 1
+            parents[index] = parent
 
-            if [x, y] == end:
-                return path, nodes_explored
+            if index == end_index:
+                return self.build_path(parents, index), nodes_explored
 
-            # Shuffle directions for variety in DFS
-            random.shuffle(directions)
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    stack.append(([nx, ny], path + [[nx, ny]]))
+            # Random direction order for variety in DFS
+            for dx, dy in NEIGHBOR_ORDERS[random.randrange(len(NEIGHBOR_ORDERS))]:
+                next_index = index + dy * width + dx
+                if not (flat_maze[next_index] or traps_bits[next_index] or visited[next_index]):
+                    stack.append((next_index, index))
         return None, nodes_explored
 
     def find_path_dls(self, start, end, depth_limit=50):
         """Depth-Limited Search - DFS with depth limit, avoiding traps"""
+        width = self.width
+        flat_maze, traps_bits = self.flat_maze, self.traps_bits
+        end_index = end[1] * width + end[0]
+        offsets = tuple(dx + dy * width for dx, dy in DIRECTIONS)
+        on_path = bytearray(len(flat_maze))  # Cells on the current recursion path
 
-        def dls_recursive(x, y, path, visited, remaining_depth):
+        def dls_recursive(index, path, remaining_depth):
             if remaining_depth < 0:
                 return None, 0
 
-            if [x, y] == end:
+            if index == end_index:
                 return path, 1
 
-            visited.add((x, y))
+            on_path[index] = 1
             nodes_explored = 1
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+            result = None
 
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
+            for offset in offsets:
+                next_index = index + offset
+                if not (flat_maze[next_index] or traps_bits[next_index] or on_path[next_index]):
                     result, explored = dls_recursive(
-                        nx, ny, path + [[nx, ny]], visited.copy(), remaining_depth - 1
+                        next_index,
+                        path + [[next_index % width, next_index // width]],
+                        remaining_depth - 1,
                     )
                     nodes_explored += explored
                     if result:
-                        return result, nodes_explored
+                        break
 
-            return None, nodes_explored
+            on_path[index] = 0
+            return result, nodes_explored
 
-        return dls_recursive(start[0], start[1], [start], set(), depth_limit)
+        return dls_recursive(start[1] * width + start[0], [list(start)], depth_limit)
 
     def find_path_ids(self, start, end, max_depth=100):
         """Iterative Deepening Search - Combines benefits of BFS and DFS, avoiding traps"""
         total_nodes_explored = 0
 
         for depth in range(max_depth):
+            if self.closing:
+                break  # Window closed; let the worker thread finish early
             result, nodes_explored = self.find_path_dls(start, end, depth)
             total_nodes_explored += nodes_explored
             if result:
@@ -868,63 +1110,88 @@ Algorithm Explanations:
 
     def find_path_bidirectional(self, start, end):
         """Bidirectional Search - Search from both start and end, avoiding traps"""
-        if start == end:
-            return [start], 1
-
-        # Forward search from start
-        forward_queue = deque([(start, [start])])
-        forward_visited = {tuple(start): [start]}
-
-        # Backward search from end
-        backward_queue = deque([(end, [end])])
-        backward_visited = {tuple(end): [end]}
+        width = self.width
+        flat_maze, traps_bits = self.flat_maze, self.traps_bits
+        start_index = start[1] * width + start[0]
+        end_index = end[1] * width + end[0]
+        if start_index == end_index:
+            return [list(start)], 1
+
+        size = len(flat_maze)
+        offsets = tuple(dx + dy * width for dx, dy in DIRECTIONS)
+        # Per side: visited flags and the cell each visited cell was reached from
+        forward_visited, backward_visited = bytearray(size), bytearray(size)
+        forward_parents, backward_parents = [-1] * size, [-1] * size
+        forward_visited[start_index] = backward_visited[end_index] = 1
+        forward_frontier = [start_index]
+        backward_frontier = [end_index]
 
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
         nodes_explored = 0
 
-        while forward_queue or backward_queue:
-            # Forward search step
-            if forward_queue:
-                (x, y), path = forward_queue.popleft()
-                nodes_explored += 1
-
-                # Check if we've met the backward search
-                if (x, y) in backward_visited:
-                    backward_path = backward_visited[(x, y)]
-                    # Reverse the backward path and combine
-                    full_path = path + backward_path[-2::-1]
-                    return full_path, nodes_explored
+        while forward_frontier and backward_frontier:
+            # Expand one whole level of the smaller frontier
+            forward = len(forward_frontier) <= len(backward_frontier)
+            if forward:
+                frontier, visited, parents, other_visited = (
+                    forward_frontier, forward_visited, forward_parents, backward_visited
+                )
+            else:
+                frontier, visited, parents, other_visited = (
+                    backward_frontier, backward_visited, backward_parents, forward_visited
+                )
 
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if self.is_safe_cell(nx, ny) and (nx, ny) not in forward_visited:
-                        new_path = path + [[nx, ny]]
-                        forward_visited[(nx, ny)] = new_path
-                        forward_queue.append(([nx, ny], new_path))
-
-            # Backward search step
-            if backward_queue:
-                (x, y), path = backward_queue.popleft()
+            next_frontier = []
+            for index in frontier:
                 nodes_explored += 1
-
-                # Check if we've met the forward search
-                if (x, y) in forward_visited:
-                    forward_path = forward_visited[(x, y)]
-                    # Reverse the backward path and combine
-                    full_path = forward_path + path[-2::-1]
-                    return full_path, nodes_explored
-
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if self.is_safe_cell(nx, ny) and (nx, ny) not in backward_visited:
-                        new_path = path + [[nx, ny]]
-                        backward_visited[(nx, ny)] = new_path
-                        backward_queue.append(([nx, ny], new_path))
+                for offset in offsets:
+                    next_index = index + offset
+                    if visited[next_index] or flat_maze[next_index] or traps_bits[next_index]:
+                        continue
+                    parents[next_index] = index
+
+                    # Check if we've met the other search
+                    if other_visited[next_index]:
+                        # Forward chain start->meet, then backward chain meet->end
+                        path = self.build_path(forward_parents, next_index)
+                        node = backward_parents[next_index]
+                        while node != -1:
+                            path.append([node % width, node // width])
+                            node = backward_parents[node]
+                        return path, nodes_explored
+
+                    visited[next_index] = 1
+                    next_frontier.append(next_index)
+
+            if forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
 
         return None, nodes_explored
 
     def find_path(self, start, end, algorithm="BFS"):
-        """Main pathfinding function that calls the selected algorithm"""
+        """Main pathfinding function that calls the selected algorithm
+
+        Results are cached per (start, end, algorithm) until the maze or traps
+        change, so Solve, Compare and Hint reuse searches already done.
+        """
+        cache_key = (start[0], start[1], end[0], end[1], algorithm)
+        cached = self.path_cache.get(cache_key)
+        if cached:
+            return cached
+
+        result = self.search(start, end, algorithm)
+        self.store_path(cache_key, result)
+        return result
+
+    def store_path(self, cache_key, result):
+        """Keep a find_path result in path_cache, resetting the cache when full"""
+        if len(self.path_cache) >= PATH_CACHE_SIZE:
+            self.path_cache.clear()
+        self.path_cache[cache_key] = result
+
+    def search(self, start, end, algorithm):
+        """Run the selected algorithm uncached, returning (path, nodes explored, seconds)"""
         start_time = time.time()
 
         if algorithm == "BFS":
@@ -961,6 +1228,16 @@ Algorithm Explanations:
         self.start_time = time.time()
         self.draw_maze()
 
+    def close(self):
+        """Close the window without waiting for background searches
+
+        Queued searches are cancelled and a running IDS stops at its next
+        depth, so the worker threads do not keep the process alive.
+        """
+        self.closing = True
+        self.search_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def run(self):
         """Start the game"""
         print("HARD Maze Game - Survival Mode with Multiple Search Algorithms")
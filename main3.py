@@ -1,11 +1,177 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
+from array import array
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
 import time
-import math
 import platform
 
+# Cell (fill, outline) colors indexed [is_wall][dimmed]; dimmed cells are
+# shown by the map reveal but lie outside the player's vision
+CELL_LOOKS = (
+    (("#f0f0f0", "#cccccc"), ("#d0d0d0", "#aaaaaa")),  # Path
+    (("#444444", "#666666"), ("#333333", "#555555")),  # Wall
+)
+
+GRID_LINE_COLOR = "#888888"  # Cell edges in the full (revealed) view
+
+# Item labels: plain text on Windows, where the emoji render poorly, emoji elsewhere
+TEXT_SYMBOLS = {"key": "K", "enemy": "E", "exit": "EXIT", "lock": "LOCK"}
+EMOJI_SYMBOLS = {"key": "🗝", "enemy": "👹", "exit": "🚪", "lock": "🔒"}
+
+PATH_CACHE_SIZE = 64  # find_path results kept before the cache is reset
+
+SEARCH_POLL_MS = 20  # How often (ms) the Tk thread checks for finished background searches
+
+# (dx, dy, wall_dx, wall_dy) steps to the next cell two squares away and the
+# wall between; order is Down, Right, Up, Left
+CARVE_DIRECTIONS = ((0, 2, 0, 1), (2, 0, 1, 0), (0, -2, 0, -1), (-2, 0, -1, 0))
+
+
+def carve_maze(maze, width, height, start_x, start_y, rng=random):
+    """Carve passages into an all-wall flat grid with an iterative backtracker"""
+    # Stack for backtracking, preallocated (it never holds more than one
+    # entry per cell) and addressed through the top pointer sp
+    stack_x = [0] * (width * height)
+    stack_y = [0] * (width * height)
+
+    maze[start_y * width + start_x] = 0
+    stack_x[0], stack_y[0] = start_x, start_y
+    sp = 1
+
+    # Fixed-size buffer of usable CARVE_DIRECTIONS entries, reused every step
+    candidates = [None] * 4
+    max_x, max_y = width - 1, height - 1
+    randrange = rng.randrange
+
+    while sp:
+        current_x, current_y = stack_x[sp - 1], stack_y[sp - 1]
+        count = 0
+
+        # Find unvisited neighbors
+        for direction in CARVE_DIRECTIONS:
+            nx, ny = current_x + direction[0], current_y + direction[1]
+            if 0 < nx < max_x and 0 < ny < max_y and maze[ny * width + nx] == 1:
+                candidates[count] = direction
+                count += 1
+
+        if count:
+            # Choose random neighbor
+            dx, dy, wall_x, wall_y = candidates[randrange(count)]
+            nx, ny = current_x + dx, current_y + dy
+
+            # Remove wall between current cell and chosen neighbor
+            maze[(current_y + wall_y) * width + current_x + wall_x] = 0
+            maze[ny * width + nx] = 0
+
+            stack_x[sp], stack_y[sp] = nx, ny
+            sp += 1
+        else:
+            sp -= 1
+
+
+def bfs_reachable(impassable, width, start_index, end_index):
+    """Grid BFS from start_index that never steps onto an impassable cell
+
+    impassable is a flat bytearray indexed by y * width + x, non-zero for walls
+    and for any other cell to avoid; the maze's outer wall border keeps every
+    neighbor offset in bounds. It is copied and the copy doubles as the
+    visited set, so each neighbor costs a single test.
+    Returns (found, parent) where parent maps a flat cell index to its
+    parent's flat index (-1 for start and for cells never reached); pass
+    end_index=-1 to get the whole BFS tree rooted at start_index.
+    """
+    parent = [-1] * len(impassable)
+    closed = bytearray(impassable)
+    closed[start_index] = 1
+    # FIFO queue in a preallocated array; every cell is enqueued at most once
+    queue = array("i", [0]) * len(impassable)
+    queue[0] = start_index
+    head, tail = 0, 1
+
+    while head < tail:
+        index = queue[head]
+        head += 1
+
+        if index == end_index:
+            return True, parent
+
+        # Down, right, up, left
+        for next_index in (index + width, index + 1, index - width, index - 1):
+            if not closed[next_index]:
+                closed[next_index] = 1
+                parent[next_index] = index
+                queue[tail] = next_index
+                tail += 1
+    return False, parent
+
+
+def bidirectional_reachable(impassable, width, start_index, end_index):
+    """Whether end_index can be reached from start_index, searching from both ends
+
+    Takes the same impassable grid as bfs_reachable. Both frontiers grow one
+    level at a time, the smaller one first, and the search stops as soon as
+    a frontier steps onto a cell already claimed by the other side.
+    """
+    if start_index == end_index:
+        return True
+    if impassable[end_index]:
+        return False
+
+    # Which side reached each cell: 1 = from start, 2 = from end
+    side = bytearray(len(impassable))
+    side[start_index] = 1
+    side[end_index] = 2
+    forward, backward = [start_index], [end_index]
+
+    while forward and backward:
+        if len(forward) <= len(backward):
+            frontier, mine, theirs = forward, 1, 2
+        else:
+            frontier, mine, theirs = backward, 2, 1
+
+        next_frontier = []
+        for index in frontier:
+            # Down, right, up, left
+            for next_index in (index + width, index + 1, index - width, index - 1):
+                reached = side[next_index]
+                if reached == theirs:
+                    return True
+                if not reached and not impassable[next_index]:
+                    side[next_index] = mine
+                    next_frontier.append(next_index)
+
+        if mine == 1:
+            forward = next_frontier
+        else:
+            backward = next_frontier
+    return False
+
+
+def reconstruct_path(parent, index, width):
+    """Follow parent links back from index, returning [[x, y], ...] from the root"""
+    path = []
+    while index != -1:
+        path.append([index % width, index // width])
+        index = parent[index]
+    path.reverse()
+    return path
+
+
+def trace_path(parents, pos):
+    """Follow (x, y) -> parent (x, y) links back from pos to the root (parent None)
+
+    Returns the path as [[x, y], ...] from the root to pos.
+    """
+    path = []
+    while pos is not None:
+        path.append(list(pos))
+        pos = parents[pos]
+    path.reverse()
+    return path
+
 
 class HardMazeGame:
     def __init__(self, width=35, height=35):
@@ -17,7 +183,14 @@ class HardMazeGame:
         self.platform = platform.system()
         self.setup_platform_settings()
         
-        self.maze = []
+        self.maze = bytearray()
+        self.overlay_state = None  # What the full view's overlay items were drawn from
+        self.path_cache = {}  # (sx, sy, ex, ey, algorithm) -> find_path result
+        # Worker threads for Compare searches, keeping the UI responsive
+        self.search_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.closing = False  # Set once the window is closed
+        # Last (text, color) set on each info label, to skip no-op updates
+        self.label_states = {}
         self.player_pos = [1, 1]
         self.end_pos = [width - 2, height - 2]
 
@@ -36,9 +209,12 @@ class HardMazeGame:
 
         # Traps and hazards
         self.traps = []
+        self.trap_cells = bytearray()  # 1 per trapped cell, indexed like self.maze
+        self.unsafe_cells = bytearray()  # 1 per wall or trapped cell, indexed like self.maze
         self.moving_walls = []
         self.wall_move_timer = 0
         self.teleporters = []
+        self.teleport_links = {}  # Flat cell index -> paired teleporter's flat index
 
         # Power-ups
         self.keys = []  # Golden keys to collect
@@ -48,11 +224,13 @@ class HardMazeGame:
         # Enemy (moving obstacle)
         self.enemy_pos = None
         self.enemy_path = []
+        self.enemy_path_index = 0  # Position of enemy_pos within enemy_path
         self.enemy_move_counter = 0
 
         # Create the main window
         self.root = tk.Tk()
         self.root.title("HARD Maze Game - Survival Mode")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.root.resizable(False, False)
         
         # Configure DPI awareness for Windows
@@ -83,6 +261,9 @@ class HardMazeGame:
 
         self.zoom_window = 9  # Number of cells to show in zoom mode (must be odd)
 
+        # Persistent canvas items, recolored in place by draw_maze
+        self.create_canvas_items()
+
         # Generate initial maze
         self.generate_maze()
         self.setup_difficulty_features()
@@ -118,6 +299,9 @@ class HardMazeGame:
             self.emoji_font_size = 13
             self.player_radius_factor = 0.33
 
+        # Item labels, chosen once instead of on every draw
+        self.symbols = TEXT_SYMBOLS if self.platform == "Windows" else EMOJI_SYMBOLS
+
     def configure_dpi_awareness(self):
         """Configure DPI awareness for better scaling on Windows"""
         if self.platform == "Windows":
@@ -270,148 +454,150 @@ class HardMazeGame:
 
     def generate_maze(self):
         """Generate a more complex maze with multiple paths and dead ends"""
-        self.maze = [[1 for _ in range(self.width)] for _ in range(self.height)]
-
-        # Create main path using recursive backtracking
-        stack = []
-        start_x, start_y = 1, 1
-        self.maze[start_y][start_x] = 0
-        stack.append((start_x, start_y))
+        width, height = self.width, self.height
 
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-
-        while stack:
-            current_x, current_y = stack[-1]
-            neighbors = []
-
-            for dx, dy in directions:
-                nx, ny = current_x + dx, current_y + dy
-                if (
-                    0 < nx < self.width - 1
-                    and 0 < ny < self.height - 1
-                    and self.maze[ny][nx] == 1
-                ):
-                    neighbors.append((nx, ny, dx // 2, dy // 2))
+        # Walls (1) and paths (0), one byte per cell, stored row-major in a
+        # flat buffer indexed by y * width + x
+        maze = bytearray(b"\x01") * (width * height)
 
-            if neighbors:
-                nx, ny, wall_x, wall_y = random.choice(neighbors)
-                self.maze[current_y + wall_y][current_x + wall_x] = 0
-                self.maze[ny][nx] = 0
-                stack.append((nx, ny))
-            else:
-                stack.pop()
+        # Create main path using recursive backtracking
+        carve_maze(maze, width, height, 1, 1)
 
         # Add extra connections to create loops (makes it harder)
-        for _ in range(self.width // 2):
-            x = random.randrange(1, self.width - 1, 2)
-            y = random.randrange(1, self.height - 1, 2)
-            if self.maze[y][x] == 0:
+        randrange, rand = random.randrange, random.random
+        for _ in range(width // 2):
+            x = randrange(1, width - 1, 2)
+            y = randrange(1, height - 1, 2)
+            if maze[y * width + x] == 0:
                 # Try to break a wall to create a loop
                 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                     nx, ny = x + dx, y + dy
                     if (
-                        0 < nx < self.width - 1
-                        and 0 < ny < self.height - 1
-                        and self.maze[ny][nx] == 1
-                        and random.random() < 0.3
+                        0 < nx < width - 1
+                        and 0 < ny < height - 1
+                        and maze[ny * width + nx] == 1
+                        and rand() < 0.3
                     ):
-                        self.maze[ny][nx] = 0
+                        maze[ny * width + nx] = 0
                         break
 
         # Ensure start and end are clear
-        self.maze[1][1] = 0
-        self.maze[self.height - 2][self.width - 2] = 0
+        maze[width + 1] = 0
+        maze[(height - 2) * width + width - 2] = 0
+
+        self.maze = maze
 
     def setup_difficulty_features(self):
         """Set up traps, keys, teleporters, and other difficulty features, ensuring solvability"""
+        # Traps and teleporters change what the searches may walk through,
+        # so cached paths are dropped whenever features are placed
+        self.path_cache = {}
+
         max_attempts = 20
+
+        # BFS tree of the bare maze rooted at the start, shared by every
+        # attempt's solvability check
+        _, start_tree = bfs_reachable(self.maze, self.width, self.width + 1, -1)
+
+        # Find all empty spaces; the maze does not change between attempts,
+        # so the scan runs once
+        empty_spaces = []
+        excluded = {(1, 1), tuple(self.end_pos)}
+        for y in range(1, self.height - 1):
+            for x in range(1, self.width - 1):
+                if self.maze[y * self.width + x] == 0 and (x, y) not in excluded:
+                    empty_spaces.append([x, y])
+
         for attempt in range(max_attempts):
             self.traps = []
             self.keys = []
             self.teleporters = []
             self.moving_walls = []
 
-            # Find all empty spaces
-            empty_spaces = []
-            for y in range(1, self.height - 1):
-                for x in range(1, self.width - 1):
-                    if self.maze[y][x] == 0 and [x, y] not in [[1, 1], self.end_pos]:
-                        empty_spaces.append([x, y])
-
-            # Place golden keys
+            # Place golden keys; shuffling once and popping replaces repeated
+            # random.choice + list.remove
             keys = []
             available = empty_spaces[:]
+            random.shuffle(available)
             for _ in range(self.required_keys):
                 if available:
-                    pos = random.choice(available)
-                    keys.append(pos)
-                    available.remove(pos)
+                    keys.append(available.pop())
             self.keys = [k[:] for k in keys]
 
+            # Cells already taken, as a set of (x, y) for constant-time lookups
+            taken = {tuple(k) for k in self.keys}
+
             # Place traps (avoid keys, start, end)
-            traps = []
-            trap_candidates = [pos for pos in empty_spaces if pos not in self.keys]
+            trap_candidates = [pos for pos in empty_spaces if tuple(pos) not in taken]
             num_traps = min(8, len(trap_candidates) // 10)
-            for _ in range(num_traps):
-                if trap_candidates:
-                    pos = random.choice(trap_candidates)
-                    traps.append(pos)
-                    trap_candidates.remove(pos)
-            self.traps = [t[:] for t in traps]
+            traps = random.sample(trap_candidates, num_traps)
+            self.set_traps([t[:] for t in traps])
+            taken.update(tuple(t) for t in traps)
 
             # Place teleporter pairs (avoid keys, traps, start, end)
-            tele_candidates = [pos for pos in empty_spaces if pos not in self.keys and pos not in self.traps]
+            tele_candidates = [pos for pos in empty_spaces if tuple(pos) not in taken]
             teleporters = []
             if len(tele_candidates) >= 4:
-                for _ in range(2):  # 2 pairs of teleporters
-                    pos1 = random.choice(tele_candidates)
-                    tele_candidates.remove(pos1)
-                    pos2 = random.choice(tele_candidates)
-                    tele_candidates.remove(pos2)
+                ends = random.sample(tele_candidates, 4)
+                for pos1, pos2 in zip(ends[::2], ends[1::2]):  # 2 pairs of teleporters
                     teleporters.append((pos1[:], pos2[:]))
-            self.teleporters = [ (a[:], b[:]) for a, b in teleporters ]
+            self.set_teleporters([(a[:], b[:]) for a, b in teleporters])
 
             # Set up enemy
-            enemy_candidates = [pos for pos in empty_spaces if pos not in self.keys and pos not in self.traps]
+            enemy_candidates = [pos for pos in empty_spaces if tuple(pos) not in taken]
             self.enemy_pos = random.choice(enemy_candidates) if enemy_candidates else None
             self.create_enemy_path()
 
             # --- NEW: Check solvability with enemy as a moving obstacle ---
             def is_solvable_with_enemy():
-                # Treat all enemy patrol positions as blocked
-                blocked = set(tuple(pos) for pos in self.enemy_path)
+                # Treat all enemy patrol positions as blocked, alongside walls
+                width = self.width
+                blocked = bytearray(self.maze)
+                for x, y in self.enemy_path:
+                    blocked[y * width + x] = 1
+                root = width + 1  # The start tree is rooted at (1, 1)
+
+                def clear_to_root(index):
+                    # Follow the start tree up from index, True only if the
+                    # walk ends at the root without crossing the patrol.
+                    # Cells the tree never reached also have parent -1, so
+                    # meeting -1 anywhere but the root means no tree route
+                    while index != root:
+                        index = start_tree[index]
+                        if index == -1 or blocked[index]:
+                            return False
+                    return True
+
                 # Helper for BFS that avoids enemy
                 def bfs_avoid_enemy(start, end):
-                    queue = deque([(start, [start])])
-                    visited = set([tuple(start)])
-                    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                    while queue:
-                        (x, y), path = queue.popleft()
-                        if [x, y] == end:
-                            return True
-                        for dx, dy in directions:
-                            nx, ny = x + dx, y + dy
-                            if (
-                                0 <= nx < self.width and 0 <= ny < self.height
-                                and self.maze[ny][nx] == 0
-                                and (nx, ny) not in visited
-                                and (nx, ny) not in blocked
-                            ):
-                                visited.add((nx, ny))
-                                queue.append(([nx, ny], path + [[nx, ny]]))
-                    return False
+                    start_index = start[1] * width + start[0]
+                    end_index = end[1] * width + end[0]
+                    # Walking start -> root -> end along the start tree is a
+                    # valid route when it misses the patrol, so the search is
+                    # only needed when the patrol sits on that route
+                    if clear_to_root(start_index) and not blocked[end_index] and clear_to_root(end_index):
+                        return True
+                    return bidirectional_reachable(blocked, width, start_index, end_index)
+
+                # Manhattan distances between every pair of start (0), keys
+                # (1..k) and exit (k + 1), computed once for the whole tour
+                points = [[1, 1]] + self.keys + [self.end_pos]
+                manhattan = [
+                    [abs(ax - bx) + abs(ay - by) for bx, by in points]
+                    for ax, ay in points
+                ]
 
                 # Check path to each key and from last key to exit
-                test_pos = [1, 1]
-                test_keys = [k[:] for k in self.keys]
-                while test_keys:
-                    nearest = min(test_keys, key=lambda k: abs(k[0] - test_pos[0]) + abs(k[1] - test_pos[1]))
-                    if not bfs_avoid_enemy(test_pos, nearest):
+                current = 0
+                remaining = list(range(1, len(points) - 1))
+                while remaining:
+                    nearest = min(remaining, key=manhattan[current].__getitem__)
+                    if not bfs_avoid_enemy(points[current], points[nearest]):
                         return False
-                    test_pos = nearest[:]
-                    test_keys.remove(nearest)
+                    current = nearest
+                    remaining.remove(nearest)
                 # Path from last key to exit
-                if not bfs_avoid_enemy(test_pos, self.end_pos):
+                if not bfs_avoid_enemy(points[current], self.end_pos):
                     return False
                 return True
 
@@ -426,25 +612,46 @@ class HardMazeGame:
         # (This is the key fix: don't keep unsolvable teleporters)
 
         # If we get here, fallback: no traps/teleporters
-        self.traps = []
-        self.teleporters = []
+        self.set_traps([])
+        self.set_teleporters([])
         self.keys = []
-        empty_spaces = []
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0 and [x, y] not in [[1, 1], self.end_pos]:
-                    empty_spaces.append([x, y])
+        available = empty_spaces[:]
+        random.shuffle(available)
         for _ in range(self.required_keys):
-            if empty_spaces:
-                pos = random.choice(empty_spaces)
-                self.keys.append(pos)
-                empty_spaces.remove(pos)
-        self.enemy_pos = random.choice(empty_spaces) if empty_spaces else None
+            if available:
+                self.keys.append(available.pop()[:])
+        self.enemy_pos = random.choice(available)[:] if available else None
         self.create_enemy_path()
         optimal_path, _, _ = self.find_path([1, 1], self.end_pos, "BFS")
         if optimal_path:
             self.max_moves = len(optimal_path) * 3
 
+    def cell_mask(self, cells):
+        """Flat bytearray, indexed like self.maze, with 1 at each [x, y] in cells"""
+        mask = bytearray(len(self.maze))
+        for x, y in cells:
+            mask[y * self.width + x] = 1
+        return mask
+
+    def set_traps(self, traps):
+        """Place traps and rebuild the flat masks the move check and searches read"""
+        self.traps = traps
+        self.trap_cells = self.cell_mask(traps)
+        unsafe = bytearray(self.maze)
+        for x, y in traps:
+            unsafe[y * self.width + x] = 1
+        self.unsafe_cells = unsafe
+
+    def set_teleporters(self, teleporters):
+        """Place teleporter pairs and rebuild the flat index links between their ends"""
+        width = self.width
+        links = {}
+        for (x1, y1), (x2, y2) in teleporters:
+            links[y1 * width + x1] = y2 * width + x2
+            links[y2 * width + x2] = y1 * width + x1
+        self.teleporters = teleporters
+        self.teleport_links = links
+
     def create_enemy_path(self):
         """Create a patrol path for the enemy"""
         if not self.enemy_pos:
@@ -452,6 +659,7 @@ class HardMazeGame:
 
         # Find nearby empty spaces for patrol
         self.enemy_path = [self.enemy_pos[:]]
+        self.enemy_path_index = 0
         current = self.enemy_pos[:]
 
         # Create a simple back-and-forth patrol
@@ -461,19 +669,94 @@ class HardMazeGame:
                 if (
                     0 <= nx < self.width
                     and 0 <= ny < self.height
-                    and self.maze[ny][nx] == 0
+                    and self.maze[ny * self.width + nx] == 0
                     and [nx, ny] not in self.enemy_path
                 ):
                     self.enemy_path.append([nx, ny])
                     current = [nx, ny]
                     break
 
+    def create_canvas_items(self):
+        """Create the cell grids and the player once; draw_maze only updates them
+
+        There is one rectangle per maze cell for the full view and one per
+        window slot for the zoomed view. cell_looks / zoom_looks hold the
+        (fill, outline) each rectangle currently shows, or None while it is
+        hidden, so a redraw only reconfigures cells whose look changed. Cells
+        outside vision are simply hidden and the black canvas background shows
+        through, rather than each being painted black.
+
+        Full-view cells have no outline of their own; a static set of grid
+        lines above them draws every cell edge once. That view is only used
+        while the whole map is revealed, so no lines run over darkness.
+        """
+        cs = self.cell_size
+        self.cell_items = [
+            self.canvas.create_rectangle(
+                x * cs, y * cs, x * cs + cs, y * cs + cs,
+                outline="", state="hidden", tags="cell"
+            )
+            for y in range(self.height)
+            for x in range(self.width)
+        ]
+        self.cell_looks = [None] * len(self.cell_items)
+
+        right, bottom = self.width * cs, self.height * cs
+        for y in range(self.height + 1):
+            self.canvas.create_line(
+                0, y * cs, right, y * cs,
+                fill=GRID_LINE_COLOR, state="hidden", tags="grid_line"
+            )
+        for x in range(self.width + 1):
+            self.canvas.create_line(
+                x * cs, 0, x * cs, bottom,
+                fill=GRID_LINE_COLOR, state="hidden", tags="grid_line"
+            )
+
+        zcs = cs * 2  # Zoomed cell size, as in draw_maze
+        self.zoom_items = [
+            self.canvas.create_rectangle(
+                x * zcs, y * zcs, x * zcs + zcs, y * zcs + zcs,
+                width=1, state="hidden", tags="zoom_cell"
+            )
+            for y in range(self.zoom_window)
+            for x in range(self.zoom_window)
+        ]
+        self.zoom_looks = [None] * len(self.zoom_items)
+        self.zoomed_view = None  # Which grid is shown; None before the first draw
+
+        # Per-frame scratch for draw_maze: squared column distance from the
+        # player, refilled in place rather than reallocated
+        self.column_dist_sq = [0] * self.width
+
+        self.player_item = self.canvas.create_oval(
+            0, 0, 0, 0, fill="blue", outline="darkblue", width=2, tags="player"
+        )
+
+    def show_cell_grid(self, zoomed):
+        """Switch between the zoomed and the full cell grid, hiding the other"""
+        if self.zoomed_view is zoomed:
+            return
+        self.zoomed_view = zoomed
+        if zoomed:
+            self.canvas.itemconfig("cell", state="hidden")
+            self.canvas.itemconfig("grid_line", state="hidden")
+            self.cell_looks = [None] * len(self.cell_items)
+        else:
+            self.canvas.itemconfig("grid_line", state="normal")
+            self.canvas.itemconfig("zoom_cell", state="hidden")
+            self.zoom_looks = [None] * len(self.zoom_items)
+
     def draw_maze(self):
         """Draw the maze with limited visibility or full reveal"""
-        self.canvas.delete("all")
-
+        # The cell grids and the player persist; items, markers and the
+        # solution are redrawn each time in the zoomed view, and in the full
+        # view only when what they show has changed
         px, py = self.player_pos
         vision_range = self.visibility_radius
+        # Bound once for the per-cell loops below
+        maze, width = self.maze, self.width
+        itemconfig = self.canvas.itemconfig
 
         # Check if map is revealed
         map_fully_visible = False
@@ -494,8 +777,17 @@ class HardMazeGame:
                 self.has_flashlight = False
                 self.flashlight_start = None
 
+        # Squared column distances for this frame; the cell loops below only
+        # add each row's term
+        dx_sq = self.column_dist_sq
+        for x in range(width):
+            dx_sq[x] = (x - px) * (x - px)
+
         # --- ZOOM LOGIC ---
         if not map_fully_visible:
+            self.canvas.delete("overlay", "solution")
+            self.overlay_state = None
+
             # Zoomed-in: only draw a window around the player
             half = self.zoom_window // 2
             start_x = max(0, px - half)
@@ -510,29 +802,31 @@ class HardMazeGame:
                 height=(end_y - start_y) * zoom_cell_size,
             )
 
+            self.show_cell_grid(zoomed=True)
+            items, looks = self.zoom_items, self.zoom_looks
+
+            # Squared distances against the squared range; no sqrt per cell
+            range_sq = vision_range * vision_range
             for y in range(start_y, end_y):
+                dy_sq = (y - py) * (y - py)
                 for x in range(start_x, end_x):
-                    distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
-                    cell_visible = distance <= vision_range
-
-                    x1 = (x - start_x) * zoom_cell_size
-                    y1 = (y - start_y) * zoom_cell_size
-                    x2 = x1 + zoom_cell_size
-                    y2 = y1 + zoom_cell_size
+                    cell_visible = dx_sq[x] + dy_sq <= range_sq
 
                     if cell_visible:
-                        if self.maze[y][x] == 1:
-                            self.canvas.create_rectangle(
-                                x1, y1, x2, y2, fill="#444444", outline="#666666", width=1
-                            )
+                        look = CELL_LOOKS[maze[y * width + x]][0]
+                    else:
+                        look = None  # Hidden over the black background
+
+                    # Recolor the window slot only if its look changed
+                    slot = (y - start_y) * self.zoom_window + x - start_x
+                    if looks[slot] != look:
+                        looks[slot] = look
+                        if look is None:
+                            itemconfig(items[slot], state="hidden")
                         else:
-                            self.canvas.create_rectangle(
-                                x1, y1, x2, y2, fill="#f0f0f0", outline="#cccccc", width=1
+                            itemconfig(
+                                items[slot], state="normal", fill=look[0], outline=look[1]
                             )
-                    else:
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill="black", outline="black", width=0
-                        )
 
             # Draw special items, player, and solution path in zoomed coordinates
             effective_vision = float('inf') if map_fully_visible else vision_range
@@ -563,42 +857,36 @@ class HardMazeGame:
             height=self.height * self.cell_size,
         )
 
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate distance from player
-                distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
+        self.show_cell_grid(zoomed=False)
+        items, looks = self.cell_items, self.cell_looks
 
-                x1, y1 = x * self.cell_size, y * self.cell_size
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
+        range_sq = vision_range * vision_range
+        for y in range(self.height):
+            dy_sq = (y - py) * (y - py)
+            for x in range(width):
+                # Squared distance from player, compared with the squared range
+                out_of_range = dx_sq[x] + dy_sq > range_sq
 
                 # Determine if cell should be visible
-                cell_visible = map_fully_visible or distance <= vision_range
+                cell_visible = map_fully_visible or not out_of_range
 
                 if cell_visible:
-                    if self.maze[y][x] == 1:  # Wall
-                        # Dim walls if map is revealed to distinguish from normal vision
-                        wall_color = "#333333" if map_fully_visible and distance > vision_range else "#444444"
-                        outline_color = "#555555" if map_fully_visible and distance > vision_range else "#666666"
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill=wall_color, outline=outline_color, width=1
-                        )
-                    else:  # Path
-                        # Dim paths if map is revealed to distinguish from normal vision
-                        path_color = "#d0d0d0" if map_fully_visible and distance > vision_range else "#f0f0f0"
-                        outline_color = "#aaaaaa" if map_fully_visible and distance > vision_range else "#cccccc"
-                        self.canvas.create_rectangle(
-                            x1, y1, x2, y2, fill=path_color, outline=outline_color, width=1
-                        )
+                    # Dim cells if map is revealed to distinguish from normal vision
+                    look = CELL_LOOKS[maze[y * width + x]][out_of_range]
                 else:
-                    # Outside vision - pure black
-                    self.canvas.create_rectangle(
-                        x1, y1, x2, y2, fill="black", outline="black", width=0
-                    )
+                    # Outside vision - hidden over the black background
+                    look = None
+
+                # Recolor the cell only if its look changed
+                index = y * width + x
+                if looks[index] != look:
+                    looks[index] = look
+                    if look is None:
+                        itemconfig(items[index], state="hidden")
+                    else:
+                        # Edges come from the grid lines, so only the fill is set
+                        itemconfig(items[index], state="normal", fill=look[0])
 
-        # Draw visible special items
-        effective_vision = float('inf') if map_fully_visible else vision_range
-        self.draw_special_items(px, py, effective_vision)
-        
         # Draw player
         self.draw_player()
 
@@ -606,6 +894,29 @@ class HardMazeGame:
         if not hasattr(self, "solution_path"):
             self.solution_path = None
 
+        # The full view shows every item wherever the player stands, so a
+        # plain move leaves the overlay as it is
+        overlay_state = (
+            tuple(map(tuple, self.keys)),
+            self.keys_collected,
+            tuple(self.enemy_pos) if self.enemy_pos else None,
+            self.traps,
+            self.teleporters,
+            self.solution_path,
+        )
+        if overlay_state == self.overlay_state:
+            if self.solution_path:
+                # Keep the path drawn above the player, as a full redraw would
+                self.canvas.tag_raise("solution")
+            return
+        self.overlay_state = overlay_state
+        self.canvas.delete("overlay", "solution")
+
+        # Draw visible special items
+        effective_vision = float('inf') if map_fully_visible else vision_range
+        self.draw_special_items(px, py, effective_vision)
+        self.canvas.tag_raise(self.player_item)
+
         # Draw solution path if it exists
         if self.solution_path:
             line_width = max(2, self.cell_size // 6)
@@ -628,6 +939,9 @@ class HardMazeGame:
 
     def draw_special_items(self, px, py, vision_range):
         """Draw keys, teleporters, enemy, etc. within vision range"""
+        # Squared distances are compared with the squared range (no sqrt)
+        range_sq = vision_range * vision_range
+
         # Draw traps if map is revealed (normally invisible)
         if vision_range == float('inf'):  # Map is fully revealed
             for trap_x, trap_y in self.traps:
@@ -635,7 +949,7 @@ class HardMazeGame:
                 x1, y1 = trap_x * self.cell_size + margin, trap_y * self.cell_size + margin
                 x2, y2 = x1 + self.cell_size - 2*margin, y1 + self.cell_size - 2*margin
                 self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="darkred", outline="red", width=1
+                    x1, y1, x2, y2, fill="darkred", outline="red", width=1, tags="overlay"
                 )
                 self.canvas.create_text(
                     trap_x * self.cell_size + self.cell_size // 2,
@@ -643,35 +957,38 @@ class HardMazeGame:
                     text="!",
                     fill="white",
                     font=("Arial", self.font_size_small, "bold"),
+                    tags="overlay",
                 )
 
         # Draw keys
         for kx, ky in self.keys:
-            if math.sqrt((kx - px) ** 2 + (ky - py) ** 2) <= vision_range:
+            if (kx - px) * (kx - px) + (ky - py) * (ky - py) <= range_sq:
                 margin = max(3, self.cell_size // 6)
                 x1, y1 = kx * self.cell_size + margin, ky * self.cell_size + margin
                 x2, y2 = x1 + self.cell_size - 2*margin, y1 + self.cell_size - 2*margin
-                self.canvas.create_oval(x1, y1, x2, y2, fill="gold", outline="orange", width=2)
+                self.canvas.create_oval(
+                    x1, y1, x2, y2, fill="gold", outline="orange", width=2, tags="overlay"
+                )
                 
                 # Use platform-appropriate text/symbol
-                key_symbol = "K" if self.platform == "Windows" else "🗝"
                 self.canvas.create_text(
                     kx * self.cell_size + self.cell_size // 2,
                     ky * self.cell_size + self.cell_size // 2,
-                    text=key_symbol,
+                    text=self.symbols["key"],
                     font=("Arial", self.font_size_small, "bold"),
-                    fill="darkgoldenrod"
+                    fill="darkgoldenrod",
+                    tags="overlay"
                 )
 
         # Draw teleporters
         for pos1, pos2 in self.teleporters:
             for tx, ty in [pos1, pos2]:
-                if math.sqrt((tx - px) ** 2 + (ty - py) ** 2) <= vision_range:
+                if (tx - px) * (tx - px) + (ty - py) * (ty - py) <= range_sq:
                     margin = max(2, self.cell_size // 8)
                     x1, y1 = tx * self.cell_size + margin, ty * self.cell_size + margin
                     x2, y2 = x1 + self.cell_size - 2*margin, y1 + self.cell_size - 2*margin
                     self.canvas.create_oval(
-                        x1, y1, x2, y2, fill="purple", outline="magenta", width=2
+                        x1, y1, x2, y2, fill="purple", outline="magenta", width=2, tags="overlay"
                     )
                     self.canvas.create_text(
                         tx * self.cell_size + self.cell_size // 2,
@@ -679,43 +996,44 @@ class HardMazeGame:
                         text="T",
                         fill="white",
                         font=("Arial", self.font_size_small, "bold"),
+                        tags="overlay",
                     )
 
         # Draw enemy
         if self.enemy_pos:
             ex, ey = self.enemy_pos
-            if math.sqrt((ex - px) ** 2 + (ey - py) ** 2) <= vision_range:
+            if (ex - px) * (ex - px) + (ey - py) * (ey - py) <= range_sq:
                 margin = max(1, self.cell_size // 10)
                 x1, y1 = ex * self.cell_size + margin, ey * self.cell_size + margin
                 x2, y2 = x1 + self.cell_size - 2*margin, y1 + self.cell_size - 2*margin
                 self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="red", outline="darkred", width=2
+                    x1, y1, x2, y2, fill="red", outline="darkred", width=2, tags="overlay"
                 )
                 
                 # Use platform-appropriate enemy symbol
-                enemy_symbol = "E" if self.platform == "Windows" else "👹"
                 self.canvas.create_text(
                     ex * self.cell_size + self.cell_size // 2,
                     ey * self.cell_size + self.cell_size // 2,
-                    text=enemy_symbol,
+                    text=self.symbols["enemy"],
                     font=("Arial", self.font_size_medium, "bold"),
-                    fill="white"
+                    fill="white",
+                    tags="overlay"
                 )
 
         # Draw start position (only if visible)
-        if math.sqrt((1 - px) ** 2 + (1 - py) ** 2) <= vision_range:
+        if (1 - px) * (1 - px) + (1 - py) * (1 - py) <= range_sq:
             margin = max(2, self.cell_size // 8)
             x1 = 1 * self.cell_size + margin
             y1 = 1 * self.cell_size + margin
             x2 = x1 + self.cell_size - 2*margin
             y2 = y1 + self.cell_size - 2*margin
             self.canvas.create_rectangle(
-                x1, y1, x2, y2, fill="lightgreen", outline="green", width=2
+                x1, y1, x2, y2, fill="lightgreen", outline="green", width=2, tags="overlay"
             )
 
         # Draw end position (only if visible and all keys collected)
         end_x, end_y = self.end_pos
-        if math.sqrt((end_x - px) ** 2 + (end_y - py) ** 2) <= vision_range:
+        if (end_x - px) * (end_x - px) + (end_y - py) * (end_y - py) <= range_sq:
             margin = max(2, self.cell_size // 8)
             x1 = end_x * self.cell_size + margin
             y1 = end_y * self.cell_size + margin
@@ -724,170 +1042,202 @@ class HardMazeGame:
             
             if self.keys_collected >= self.required_keys:
                 self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="lightcoral", outline="red", width=2
+                    x1, y1, x2, y2, fill="lightcoral", outline="red", width=2, tags="overlay"
                 )
-                door_symbol = "EXIT" if self.platform == "Windows" else "🚪"
                 self.canvas.create_text(
                     end_x * self.cell_size + self.cell_size // 2,
                     end_y * self.cell_size + self.cell_size // 2,
-                    text=door_symbol,
+                    text=self.symbols["exit"],
                     font=("Arial", self.font_size_small, "bold"),
-                    fill="darkred"
+                    fill="darkred",
+                    tags="overlay"
                 )
             else:
                 self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="gray", outline="darkgray", width=2
+                    x1, y1, x2, y2, fill="gray", outline="darkgray", width=2, tags="overlay"
                 )
-                lock_symbol = "LOCK" if self.platform == "Windows" else "🔒"
                 self.canvas.create_text(
                     end_x * self.cell_size + self.cell_size // 2,
                     end_y * self.cell_size + self.cell_size // 2,
-                    text=lock_symbol,
+                    text=self.symbols["lock"],
                     font=("Arial", self.font_size_small, "bold"),
-                    fill="white"
+                    fill="white",
+                    tags="overlay"
                 )
 
     def draw_special_items_zoom(self, px, py, vision_range, start_x, start_y, cell_size):
         """Draw keys, teleporters, enemy, etc. within vision range for zoomed-in view"""
+        # Squared distances are compared with the squared range (no sqrt);
+        # an infinite range squares to infinity, so every test still passes
+        range_sq = vision_range * vision_range
+
+        # Bound once for all the items below
+        create_oval = self.canvas.create_oval
+        create_rectangle = self.canvas.create_rectangle
+        create_text = self.canvas.create_text
+        small_font = ("Arial", self.font_size_small, "bold")
+        symbols = self.symbols
+
+        # Per-item geometry depends only on cell_size: each marker spans
+        # [near, far] from its cell's top-left corner (ox, oy) and its label
+        # sits at the cell center, so these offsets are worked out once
+        center = cell_size // 2
+        key_near = max(3, cell_size // 6)
+        key_far = cell_size - key_near
+        marker_near = max(2, cell_size // 8)  # Traps, teleporters, start, exit
+        marker_far = cell_size - marker_near
+        enemy_near = max(1, cell_size // 10)
+        enemy_far = cell_size - enemy_near
+
         # Draw traps if map is revealed (normally invisible)
         if vision_range == float('inf'):  # Map is fully revealed
             for trap_x, trap_y in self.traps:
-                margin = max(2, cell_size // 8)
-                x1, y1 = (trap_x - start_x) * cell_size + margin, (trap_y - start_y) * cell_size + margin
-                x2, y2 = x1 + cell_size - 2*margin, y1 + cell_size - 2*margin
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="darkred", outline="red", width=1
+                ox, oy = (trap_x - start_x) * cell_size, (trap_y - start_y) * cell_size
+                create_rectangle(
+                    ox + marker_near, oy + marker_near,
+                    ox + marker_far, oy + marker_far,
+                    fill="darkred", outline="red", width=1, tags="overlay"
                 )
-                self.canvas.create_text(
-                    (trap_x - start_x) * cell_size + cell_size // 2,
-                    (trap_y - start_y) * cell_size + cell_size // 2,
+                create_text(
+                    ox + center,
+                    oy + center,
                     text="!",
                     fill="white",
-                    font=("Arial", self.font_size_small, "bold"),
+                    font=small_font,
+                    tags="overlay",
                 )
 
+        # Cull keys and teleporter ends in one pass: only those inside both
+        # the zoom window and the vision disk are drawn, since anything
+        # outside the window would land off the canvas
+        half = self.zoom_window // 2
+        end_x = min(self.width, px + half + 1)
+        end_y = min(self.height, py + half + 1)
+        shown_keys = [
+            (kx, ky)
+            for kx, ky in self.keys
+            if start_x <= kx < end_x
+            and start_y <= ky < end_y
+            and (kx - px) * (kx - px) + (ky - py) * (ky - py) <= range_sq
+        ]
+        shown_teleporters = [
+            (tx, ty)
+            for pair in self.teleporters
+            for tx, ty in pair
+            if start_x <= tx < end_x
+            and start_y <= ty < end_y
+            and (tx - px) * (tx - px) + (ty - py) * (ty - py) <= range_sq
+        ]
+
         # Draw keys
-        for kx, ky in self.keys:
-            if math.sqrt((kx - px) ** 2 + (ky - py) ** 2) <= vision_range:
-                margin = max(3, cell_size // 6)
-                x1 = (kx - start_x) * cell_size + margin
-                y1 = (ky - start_y) * cell_size + margin
-                x2 = x1 + cell_size - 2*margin
-                y2 = y1 + cell_size - 2*margin
-                self.canvas.create_oval(x1, y1, x2, y2, fill="gold", outline="orange", width=2)
-                key_symbol = "K" if self.platform == "Windows" else "🗝"
-                self.canvas.create_text(
-                    (kx - start_x) * cell_size + cell_size // 2,
-                    (ky - start_y) * cell_size + cell_size // 2,
-                    text=key_symbol,
-                    font=("Arial", self.font_size_small, "bold"),
-                    fill="darkgoldenrod"
-                )
+        for kx, ky in shown_keys:
+            ox, oy = (kx - start_x) * cell_size, (ky - start_y) * cell_size
+            create_oval(
+                ox + key_near, oy + key_near,
+                ox + key_far, oy + key_far,
+                fill="gold", outline="orange", width=2, tags="overlay"
+            )
+            create_text(
+                ox + center,
+                oy + center,
+                text=symbols["key"],
+                font=small_font,
+                fill="darkgoldenrod",
+                tags="overlay"
+            )
 
         # Draw teleporters
-        for pos1, pos2 in self.teleporters:
-            for tx, ty in [pos1, pos2]:
-                if math.sqrt((tx - px) ** 2 + (ty - py) ** 2) <= vision_range:
-                    margin = max(2, cell_size // 8)
-                    x1 = (tx - start_x) * cell_size + margin
-                    y1 = (ty - start_y) * cell_size + margin
-                    x2 = x1 + cell_size - 2*margin
-                    y2 = y1 + cell_size - 2*margin
-                    self.canvas.create_oval(
-                        x1, y1, x2, y2, fill="purple", outline="magenta", width=2
-                    )
-                    self.canvas.create_text(
-                        (tx - start_x) * cell_size + cell_size // 2,
-                        (ty - start_y) * cell_size + cell_size // 2,
-                        text="T",
-                        fill="white",
-                        font=("Arial", self.font_size_small, "bold"),
-                    )
+        for tx, ty in shown_teleporters:
+            ox, oy = (tx - start_x) * cell_size, (ty - start_y) * cell_size
+            create_oval(
+                ox + marker_near, oy + marker_near,
+                ox + marker_far, oy + marker_far,
+                fill="purple", outline="magenta", width=2, tags="overlay"
+            )
+            create_text(
+                ox + center,
+                oy + center,
+                text="T",
+                fill="white",
+                font=small_font,
+                tags="overlay",
+            )
 
         # Draw enemy
         if self.enemy_pos:
             ex, ey = self.enemy_pos
-            if math.sqrt((ex - px) ** 2 + (ey - py) ** 2) <= vision_range:
-                margin = max(1, cell_size // 10)
-                x1 = (ex - start_x) * cell_size + margin
-                y1 = (ey - start_y) * cell_size + margin
-                x2 = x1 + cell_size - 2*margin
-                y2 = y1 + cell_size - 2*margin
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="red", outline="darkred", width=2
+            if (ex - px) * (ex - px) + (ey - py) * (ey - py) <= range_sq:
+                ox, oy = (ex - start_x) * cell_size, (ey - start_y) * cell_size
+                create_rectangle(
+                    ox + enemy_near, oy + enemy_near,
+                    ox + enemy_far, oy + enemy_far,
+                    fill="red", outline="darkred", width=2, tags="overlay"
                 )
-                enemy_symbol = "E" if self.platform == "Windows" else "👹"
-                self.canvas.create_text(
-                    (ex - start_x) * cell_size + cell_size // 2,
-                    (ey - start_y) * cell_size + cell_size // 2,
-                    text=enemy_symbol,
+                create_text(
+                    ox + center,
+                    oy + center,
+                    text=symbols["enemy"],
                     font=("Arial", self.font_size_medium, "bold"),
-                    fill="white"
+                    fill="white",
+                    tags="overlay"
                 )
 
         # Draw start position (only if visible)
-        if math.sqrt((1 - px) ** 2 + (1 - py) ** 2) <= vision_range:
-            margin = max(2, cell_size // 8)
-            x1 = (1 - start_x) * cell_size + margin
-            y1 = (1 - start_y) * cell_size + margin
-            x2 = x1 + cell_size - 2*margin
-            y2 = y1 + cell_size - 2*margin
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2, fill="lightgreen", outline="green", width=2
+        if (1 - px) * (1 - px) + (1 - py) * (1 - py) <= range_sq:
+            ox, oy = (1 - start_x) * cell_size, (1 - start_y) * cell_size
+            create_rectangle(
+                ox + marker_near, oy + marker_near,
+                ox + marker_far, oy + marker_far,
+                fill="lightgreen", outline="green", width=2, tags="overlay"
             )
 
         # Draw end position (only if visible and all keys collected)
         end_x, end_y = self.end_pos
-        if math.sqrt((end_x - px) ** 2 + (end_y - py) ** 2) <= vision_range:
-            margin = max(2, cell_size // 8)
-            x1 = (end_x - start_x) * cell_size + margin
-            y1 = (end_y - start_y) * cell_size + margin
-            x2 = x1 + cell_size - 2*margin
-            y2 = y1 + cell_size - 2*margin
-            
+        if (end_x - px) * (end_x - px) + (end_y - py) * (end_y - py) <= range_sq:
+            ox, oy = (end_x - start_x) * cell_size, (end_y - start_y) * cell_size
+            x1, y1 = ox + marker_near, oy + marker_near
+            x2, y2 = ox + marker_far, oy + marker_far
+
             if self.keys_collected >= self.required_keys:
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="lightcoral", outline="red", width=2
+                create_rectangle(
+                    x1, y1, x2, y2, fill="lightcoral", outline="red", width=2, tags="overlay"
                 )
-                door_symbol = "EXIT" if self.platform == "Windows" else "🚪"
-                self.canvas.create_text(
-                    (end_x - start_x) * cell_size + cell_size // 2,
-                    (end_y - start_y) * cell_size + cell_size // 2,
-                    text=door_symbol,
-                    font=("Arial", self.font_size_small, "bold"),
-                    fill="darkred"
+                create_text(
+                    ox + center,
+                    oy + center,
+                    text=symbols["exit"],
+                    font=small_font,
+                    fill="darkred",
+                    tags="overlay"
                 )
             else:
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="gray", outline="darkgray", width=2
+                create_rectangle(
+                    x1, y1, x2, y2, fill="gray", outline="darkgray", width=2, tags="overlay"
                 )
-                lock_symbol = "LOCK" if self.platform == "Windows" else "🔒"
-                self.canvas.create_text(
-                    (end_x - start_x) * cell_size + cell_size // 2,
-                    (end_y - start_y) * cell_size + cell_size // 2,
-                    text=lock_symbol,
-                    font=("Arial", self.font_size_small, "bold"),
-                    fill="white"
+                create_text(
+                    ox + center,
+                    oy + center,
+                    text=symbols["lock"],
+                    font=small_font,
+                    fill="white",
+                    tags="overlay"
                 )
 
     def draw_player(self):
         """Draw player at current position"""
-        self.canvas.delete("player")
         px, py = self.player_pos
         center_x = px * self.cell_size + self.cell_size // 2
         center_y = py * self.cell_size + self.cell_size // 2
         radius = int(self.cell_size * self.player_radius_factor)
 
-        self.canvas.create_oval(
+        self.canvas.coords(
+            self.player_item,
             center_x - radius,
             center_y - radius,
             center_x + radius,
             center_y + radius,
-            fill="blue",
-            outline="darkblue",
-            width=2,
-            tags="player",
         )
+        self.canvas.tag_raise(self.player_item)
 
     def draw_player_zoom(self, start_x, start_y, cell_size):
         """Draw the player in zoomed-in coordinates"""
@@ -895,16 +1245,14 @@ class HardMazeGame:
         center_x = (px - start_x) * cell_size + cell_size // 2
         center_y = (py - start_y) * cell_size + cell_size // 2
         radius = int(cell_size * self.player_radius_factor)
-        self.canvas.create_oval(
+        self.canvas.coords(
+            self.player_item,
             center_x - radius,
             center_y - radius,
             center_x + radius,
             center_y + radius,
-            fill="blue",
-            outline="darkblue",
-            width=2,
-            tags="player",
         )
+        self.canvas.tag_raise(self.player_item)
 
     def on_key_press(self, event):
         """Handle keyboard input with additional features"""
@@ -949,14 +1297,14 @@ class HardMazeGame:
         if (
             0 <= new_x < self.width
             and 0 <= new_y < self.height
-            and self.maze[new_y][new_x] == 0
+            and self.maze[new_y * self.width + new_x] == 0
         ):
 
             self.player_pos = [new_x, new_y]
             self.moves_count += 1
 
             # Check for trap
-            if self.player_pos in self.traps:
+            if self.trap_cells[new_y * self.width + new_x]:
                 messagebox.showwarning("Trap!", "You stepped on a trap! Game Over!")
                 self.reset_game()
                 return
@@ -977,15 +1325,10 @@ class HardMazeGame:
                 )
 
             # Check for teleporter
-            for pos1, pos2 in self.teleporters:
-                if self.player_pos == pos1:
-                    self.player_pos = pos2[:]
-                    messagebox.showinfo("Teleported!", "You've been teleported!")
-                    break
-                elif self.player_pos == pos2:
-                    self.player_pos = pos1[:]
-                    messagebox.showinfo("Teleported!", "You've been teleported!")
-                    break
+            teleported = self.get_teleport(new_x, new_y)
+            if teleported is not None:
+                self.player_pos = teleported
+                messagebox.showinfo("Teleported!", "You've been teleported!")
 
             self.draw_maze()
 
@@ -1008,15 +1351,23 @@ class HardMazeGame:
 
         self.enemy_move_counter += 1
         if self.enemy_move_counter >= 5:  # Move every 5 game loops
-            current_index = (
-                self.enemy_path.index(self.enemy_pos)
-                if self.enemy_pos in self.enemy_path
-                else 0
-            )
-            next_index = (current_index + 1) % len(self.enemy_path)
-            self.enemy_pos = self.enemy_path[next_index][:]
+            # The enemy only ever steps along its patrol, so a running
+            # index replaces searching the path for its position
+            self.enemy_path_index = (self.enemy_path_index + 1) % len(self.enemy_path)
+            self.enemy_pos = self.enemy_path[self.enemy_path_index][:]
             self.enemy_move_counter = 0
 
+    def set_label(self, label, text, fg=None):
+        """Reconfigure a label only when its text or color actually changed"""
+        shown = (text, fg)
+        if self.label_states.get(label) == shown:
+            return
+        if fg is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, fg=fg)
+        self.label_states[label] = shown
+
     def update_info(self):
         """Update the information display"""
         if self.start_time:
@@ -1024,7 +1375,7 @@ class HardMazeGame:
             remaining = max(0, self.time_limit - elapsed)
             minutes = int(remaining // 60)
             seconds = int(remaining % 60)
-            self.time_label.config(text=f"Time: {minutes}:{seconds:02d}")
+            self.set_label(self.time_label, f"Time: {minutes}:{seconds:02d}")
 
             if remaining <= 0:
                 messagebox.showwarning("Time's Up!", "You ran out of time! Game Over!")
@@ -1034,7 +1385,7 @@ class HardMazeGame:
         moves_text = f"Moves: {self.moves_count}"
         if self.max_moves:
             moves_text += f"/{self.max_moves}"
-        self.moves_label.config(text=moves_text)
+        self.set_label(self.moves_label, moves_text)
 
         if self.max_moves and self.moves_count >= self.max_moves:
             messagebox.showwarning(
@@ -1043,29 +1394,29 @@ class HardMazeGame:
             self.reset_game()
             return
 
-        self.keys_label.config(text=f"Keys: {self.keys_collected}/{self.required_keys}")
+        self.set_label(self.keys_label, f"Keys: {self.keys_collected}/{self.required_keys}")
 
         # Flashlight status
         if self.has_flashlight and self.flashlight_start:
             remaining_flash = max(
                 0, self.flashlight_duration - (time.time() - self.flashlight_start)
             )
-            self.flashlight_label.config(
-                text=f"F: Flash {remaining_flash:.0f}s", fg="yellow"
+            self.set_label(
+                self.flashlight_label, f"F: Flash {remaining_flash:.0f}s", "yellow"
             )
         else:
-            self.flashlight_label.config(text="F: Flashlight", fg="gray")
+            self.set_label(self.flashlight_label, "F: Flashlight", "gray")
 
         # Reveal map status
         if self.map_revealed and self.reveal_start:
             remaining_reveal = max(
                 0, self.reveal_duration - (time.time() - self.reveal_start)
             )
-            self.reveal_label.config(
-                text=f"R: Reveal {remaining_reveal:.0f}s", fg="cyan"
+            self.set_label(
+                self.reveal_label, f"R: Reveal {remaining_reveal:.0f}s", "cyan"
             )
         else:
-            self.reveal_label.config(text="R: Reveal Map", fg="gray")
+            self.set_label(self.reveal_label, "R: Reveal Map", "gray")
 
     def show_solution(self):
         """Show the solution path using selected algorithm"""
@@ -1074,11 +1425,7 @@ class HardMazeGame:
 
         # If player needs keys, find path to nearest key first
         if self.keys_collected < self.required_keys and self.keys:
-            target = min(
-                self.keys,
-                key=lambda k: abs(k[0] - self.player_pos[0])
-                + abs(k[1] - self.player_pos[1]),
-            )
+            target = self.nearest_key(*self.player_pos)
             path_result = self.find_path(self.player_pos, target, algorithm)
         else:
             path_result = self.find_path(self.player_pos, self.end_pos, algorithm)
@@ -1118,16 +1465,26 @@ class HardMazeGame:
 
         # If player needs keys, compare paths to nearest key
         if self.keys_collected < self.required_keys and self.keys:
-            end_pos = min(
-                self.keys,
-                key=lambda k: abs(k[0] - start_pos[0]) + abs(k[1] - start_pos[1]),
-            )
+            end_pos = self.nearest_key(*start_pos)
+
+        # Every step costs 1, so without teleporters UCS finds the same
+        # shortest path BFS does; only BFS is run and shown for both
+        searched = algorithms
+        if not self.teleporters:
+            searched = [algorithm for algorithm in algorithms if algorithm != "UCS"]
 
+        self.run_searches(
+            start_pos, end_pos, searched,
+            lambda futures: self.show_comparison(algorithms, dict(zip(searched, futures))),
+        )
+
+    def show_comparison(self, algorithms, futures):
+        """Show finished compare_algorithms searches, given one future per algorithm run"""
         results = []
 
         for algorithm in algorithms:
             try:
-                path_result = self.find_path(start_pos, end_pos, algorithm)
+                path_result = futures.get(algorithm, futures["BFS"]).result()
                 if len(path_result) == 3:
                     path, nodes_explored, search_time = path_result
                 else:
@@ -1213,11 +1570,7 @@ Performance Notes:
         # Find direction to nearest key or exit
         target = None
         if self.keys:
-            target = min(
-                self.keys,
-                key=lambda k: abs(k[0] - self.player_pos[0])
-                + abs(k[1] - self.player_pos[1]),
-            )
+            target = self.nearest_key(*self.player_pos)
         elif self.keys_collected >= self.required_keys:
             target = self.end_pos
 
@@ -1257,143 +1610,229 @@ Performance Notes:
 
         self.root.after(200, self.game_loop)  # Run every 200ms
 
-    def is_safe_cell(self, x, y):
-        """Check if a cell is safe to move to (not a wall, trap, or enemy)"""
-        # Check bounds
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
-
-        # Check if it's a wall
-        if self.maze[y][x] == 1:
-            return False
+    def run_searches(self, start, end, algorithms, callback):
+        """Run each algorithm's search on the search pool, unless already cached
+
+        Once all are done, callback(futures) is called on the Tk thread with
+        one future per algorithm, in order. Workers never touch path_cache:
+        results are stored from the Tk thread, and only if the features were
+        not placed again meanwhile. Placing features replaces path_cache
+        before it swaps unsafe_cells and teleport_links, so a search that
+        could have read the old or half-updated grids is always dropped.
+        """
+        cache = self.path_cache
+        cache_keys = [(start[0], start[1], end[0], end[1], algorithm) for algorithm in algorithms]
+        futures = []
+        searched = []  # (cache key, future) for the searches actually run
+        for cache_key, algorithm in zip(cache_keys, algorithms):
+            cached = cache.get(cache_key)
+            if cached:
+                # No search runs, so none is timed
+                future = Future()
+                future.set_result((cached[0], cached[1], 0.0))
+            else:
+                future = self.search_pool.submit(self.search, start, end, algorithm)
+                searched.append((cache_key, future))
+            futures.append(future)
 
-        # Check if it's a trap
-        if [x, y] in self.traps:
-            return False
+        def poll():
+            if self.path_cache is not cache:
+                messagebox.showinfo(
+                    "Search Cancelled",
+                    "The maze changed before the search finished. Please try again.",
+                )
+                return
+            if all(future.done() for future in futures):
+                for cache_key, future in searched:
+                    if future.exception() is None:
+                        self.store_path(cache_key, future.result())
+                callback(futures)
+            else:
+                self.root.after(SEARCH_POLL_MS, poll)
 
-        return True
+        self.root.after(SEARCH_POLL_MS, poll)
 
     def get_teleport(self, x, y):
         """Return teleported position if (x, y) is a teleporter, else None"""
-        for pos1, pos2 in self.teleporters:
-            if [x, y] == pos1:
-                return pos2[:]
-            if [x, y] == pos2:
-                return pos1[:]
-        return None
+        index = self.teleport_links.get(y * self.width + x)
+        if index is None:
+            return None
+        return [index % self.width, index // self.width]
+
+    def nearest_key(self, x, y):
+        """Return the remaining key closest to (x, y) by Manhattan distance, or None"""
+        # Plain loop instead of min() with a key lambda; ties go to the
+        # earliest key, as with min()
+        nearest = None
+        best = None
+        for key in self.keys:
+            distance = abs(key[0] - x) + abs(key[1] - y)
+            if best is None or distance < best:
+                nearest, best = key, distance
+        return nearest
 
     def find_path_bfs(self, start, end):
         """Breadth-First Search - Guarantees shortest path, avoiding traps and using teleporters"""
-        queue = deque([(start, [start])])
-        visited = set([tuple(start)])
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        width = self.width
+        # Walls, traps and visited cells share one byte per cell, so each
+        # neighbor costs a single test
+        closed = bytearray(self.unsafe_cells)
+        teleports = self.teleport_links
+
+        start_index = start[1] * width + start[0]
+        end_index = end[1] * width + end[0]
+        # Queue holds flat cell indices only; paths are rebuilt from parent
+        # links once end is reached
+        parent = [-1] * len(closed)
+        closed[start_index] = 1
+        queue = deque([start_index])
         nodes_explored = 0
 
         while queue:
-            (x, y), path = queue.popleft()
+            index = queue.popleft()
             nodes_explored += 1
 
-            if [x, y] == end:
-                return path, nodes_explored
+            if index == end_index:
+                return reconstruct_path(parent, index, width), nodes_explored
 
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append(([nx, ny], path + [[nx, ny]]))
+            # Down, right, up, left
+            for next_index in (index + width, index + 1, index - width, index - 1):
+                if not closed[next_index]:
+                    closed[next_index] = 1
+                    parent[next_index] = index
+                    queue.append(next_index)
                     # Check teleport
-                    tele = self.get_teleport(nx, ny)
-                    if tele and tuple(tele) not in visited:
-                        visited.add(tuple(tele))
-                        queue.append((tele, path + [[nx, ny], tele]))
+                    tele = teleports.get(next_index)
+                    if tele is not None and not closed[tele]:
+                        closed[tele] = 1
+                        parent[tele] = next_index
+                        queue.append(tele)
         return None, nodes_explored
 
     def find_path_ucs(self, start, end):
         """Uniform-Cost Search - Like BFS but with priority queue for weighted graphs, avoiding traps"""
         import heapq
 
-        heap = [(0, start, [start])]  # (cost, position, path)
-        visited = set()
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        # Heap entries carry the parent position instead of a path copy;
+        # parents doubles as the visited set
+        heap = [(0, start[0], start[1], None)]  # (cost, x, y, parent)
+        parents = {}
+        goal = tuple(end)  # Compared as a tuple, like the parents keys
+        directions = ((0, 1), (1, 0), (0, -1), (-1, 0))
         nodes_explored = 0
+        # Walls and traps in one flat mask; the outer wall keeps every
+        # neighbor of a reachable cell in bounds
+        width = self.width
+        unsafe = self.unsafe_cells
+        heappush, heappop = heapq.heappush, heapq.heappop
 
         while heap:
-            cost, (x, y), path = heapq.heappop(heap)
+            cost, x, y, parent = heappop(heap)
             nodes_explored += 1
 
-            if (x, y) in visited:
+            pos = (x, y)
+            if pos in parents:
                 continue
-            visited.add((x, y))
+            parents[pos] = parent
 
-            if [x, y] == end:
-                return path, nodes_explored
+            if pos == goal:
+                return trace_path(parents, pos), nodes_explored
 
+            new_cost = cost + 1  # Each step costs 1
             for dx, dy in directions:
                 nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    new_cost = cost + 1  # Each step costs 1
-                    heapq.heappush(heap, (new_cost, [nx, ny], path + [[nx, ny]]))
+                if not unsafe[ny * width + nx] and (nx, ny) not in parents:
+                    heappush(heap, (new_cost, nx, ny, pos))
         return None, nodes_explored
 
     def find_path_dfs(self, start, end):
         """Depth-First Search - May not find shortest path, avoiding traps"""
-        stack = [(start, [start])]
-        visited = set()
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        width = self.width
+        # Same flat layout as BFS: walls, traps and visited cells share one
+        # byte per cell, and the outer wall keeps every neighbor in bounds
+        closed = bytearray(self.unsafe_cells)
+        start_index = start[1] * width + start[0]
+        end_index = end[1] * width + end[0]
+        parent = [-1] * len(closed)
+        stack = [(start_index, -1)]  # (cell index, parent index)
+        # Down, right, up, left as flat index offsets, shuffled once per
+        # search for variety between runs
+        offsets = [width, 1, -width, -1]
+        random.shuffle(offsets)
         nodes_explored = 0
 
         while stack:
-            (x, y), path = stack.pop()
+            index, from_index = stack.pop()
             nodes_explored += 1
 
-            if (x, y) in visited:
+            if closed[index]:
                 continue
-            visited.add((x, y))
+            closed[index] = 1
+            parent[index] = from_index
 
-            if [x, y] == end:
-                return path, nodes_explored
+            if index == end_index:
+                return reconstruct_path(parent, index, width), nodes_explored
 
-            # Shuffle directions for variety in DFS
-            random.shuffle(directions)
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    stack.append(([nx, ny], path + [[nx, ny]]))
+            for offset in offsets:
+                next_index = index + offset
+                if not closed[next_index]:
+                    stack.append((next_index, index))
         return None, nodes_explored
 
     def find_path_dls(self, start, end, depth_limit=50):
         """Depth-Limited Search - DFS with depth limit, avoiding traps"""
+        if depth_limit < 0:
+            return None, 0
+        if start == end:
+            return [start], 1
 
-        def dls_recursive(x, y, path, visited, remaining_depth):
-            if remaining_depth < 0:
-                return None, 0
-
-            if [x, y] == end:
-                return path, 1
-
-            visited.add((x, y))
-            nodes_explored = 1
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_safe_cell(nx, ny) and (nx, ny) not in visited:
-                    result, explored = dls_recursive(
-                        nx, ny, path + [[nx, ny]], visited.copy(), remaining_depth - 1
-                    )
-                    nodes_explored += explored
-                    if result:
-                        return result, nodes_explored
+        width = self.width
+        start_index = start[1] * width + start[0]
+        end_index = end[1] * width + end[0]
+        # Cells on the current path are marked on one shared grid next to
+        # walls and traps, set on descent and cleared on backtrack, instead
+        # of copying a visited set for every branch
+        on_path = bytearray(self.unsafe_cells)
+        on_path[start_index] = 1
+        # Down, right, up, left as flat index offsets
+        offsets = (width, 1, -width, -1)
+
+        # Explicit stack in place of recursion: the path so far, and for
+        # each cell on it the next direction still to try
+        path = [start_index]
+        next_direction = [0]
+        nodes_explored = 1
+
+        while path:
+            index = path[-1]
+            direction = next_direction[-1]
+            if direction == 4 or len(path) > depth_limit:
+                # Every direction tried, or no depth left: backtrack
+                path.pop()
+                next_direction.pop()
+                on_path[index] = 0
+                continue
+            next_direction[-1] = direction + 1
 
-            return None, nodes_explored
+            next_index = index + offsets[direction]
+            if on_path[next_index]:
+                continue
+            nodes_explored += 1
+            path.append(next_index)
+            if next_index == end_index:
+                return [[i % width, i // width] for i in path], nodes_explored
+            on_path[next_index] = 1
+            next_direction.append(0)
 
-        return dls_recursive(start[0], start[1], [start], set(), depth_limit)
+        return None, nodes_explored
 
     def find_path_ids(self, start, end, max_depth=100):
         """Iterative Deepening Search - Combines benefits of BFS and DFS, avoiding traps"""
         total_nodes_explored = 0
 
         for depth in range(max_depth):
+            if self.closing:
+                break  # Window closed; let the worker thread finish early
             result, nodes_explored = self.find_path_dls(start, end, depth)
             total_nodes_explored += nodes_explored
             if result:
@@ -1406,60 +1845,90 @@ Performance Notes:
         if start == end:
             return [start], 1
 
+        width = self.width
+        unsafe = self.unsafe_cells
+        start_index = start[1] * width + start[0]
+        end_index = end[1] * width + end[0]
+
+        # Each side keeps flat parent links, -2 marking cells it has not
+        # reached, so a parent list doubles as that side's visited set
         # Forward search from start
-        forward_queue = deque([(start, [start])])
-        forward_visited = {tuple(start): [start]}
+        forward_queue = deque([start_index])
+        forward_parent = [-2] * len(unsafe)
+        forward_parent[start_index] = -1
 
         # Backward search from end
-        backward_queue = deque([(end, [end])])
-        backward_visited = {tuple(end): [end]}
+        backward_queue = deque([end_index])
+        backward_parent = [-2] * len(unsafe)
+        backward_parent[end_index] = -1
+
+        def joined_path(meet):
+            # Forward half up to meet, then the backward links on to end
+            path = reconstruct_path(forward_parent, meet, width)
+            index = backward_parent[meet]
+            while index != -1:
+                path.append([index % width, index // width])
+                index = backward_parent[index]
+            return path
 
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
         nodes_explored = 0
 
         while forward_queue or backward_queue:
             # Forward search step
             if forward_queue:
-                (x, y), path = forward_queue.popleft()
+                index = forward_queue.popleft()
                 nodes_explored += 1
 
                 # Check if we've met the backward search
-                if (x, y) in backward_visited:
-                    backward_path = backward_visited[(x, y)]
-                    # Reverse the backward path and combine
-                    full_path = path + backward_path[-2::-1]
-                    return full_path, nodes_explored
+                if backward_parent[index] != -2:
+                    return joined_path(index), nodes_explored
 
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if self.is_safe_cell(nx, ny) and (nx, ny) not in forward_visited:
-                        new_path = path + [[nx, ny]]
-                        forward_visited[(nx, ny)] = new_path
-                        forward_queue.append(([nx, ny], new_path))
+                # Down, right, up, left
+                for next_index in (index + width, index + 1, index - width, index - 1):
+                    if not unsafe[next_index] and forward_parent[next_index] == -2:
+                        forward_parent[next_index] = index
+                        forward_queue.append(next_index)
 
             # Backward search step
             if backward_queue:
-                (x, y), path = backward_queue.popleft()
+                index = backward_queue.popleft()
                 nodes_explored += 1
 
                 # Check if we've met the forward search
-                if (x, y) in forward_visited:
-                    forward_path = forward_visited[(x, y)]
-                    # Reverse the backward path and combine
-                    full_path = forward_path + path[-2::-1]
-                    return full_path, nodes_explored
+                if forward_parent[index] != -2:
+                    return joined_path(index), nodes_explored
 
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    if self.is_safe_cell(nx, ny) and (nx, ny) not in backward_visited:
-                        new_path = path + [[nx, ny]]
-                        backward_visited[(nx, ny)] = new_path
-                        backward_queue.append(([nx, ny], new_path))
+                for next_index in (index + width, index + 1, index - width, index - 1):
+                    if not unsafe[next_index] and backward_parent[next_index] == -2:
+                        backward_parent[next_index] = index
+                        backward_queue.append(next_index)
 
         return None, nodes_explored
 
     def find_path(self, start, end, algorithm="BFS"):
-        """Main pathfinding function that calls the selected algorithm"""
+        """Main pathfinding function that calls the selected algorithm
+
+        Results are cached per (start, end, algorithm) until the features are
+        placed again, so Solve, Compare and the move limit reuse searches.
+        A cached result reports a search time of 0.0, since no search ran.
+        """
+        cache_key = (start[0], start[1], end[0], end[1], algorithm)
+        cached = self.path_cache.get(cache_key)
+        if cached:
+            return cached[0], cached[1], 0.0
+
+        result = self.search(start, end, algorithm)
+        self.store_path(cache_key, result)
+        return result
+
+    def store_path(self, cache_key, result):
+        """Keep a find_path result in path_cache, resetting the cache when full"""
+        if len(self.path_cache) >= PATH_CACHE_SIZE:
+            self.path_cache.clear()
+        self.path_cache[cache_key] = result
+
+    def search(self, start, end, algorithm):
+        """Run the selected algorithm uncached, returning (path, nodes explored, seconds)"""
         start_time = time.time()
 
         if algorithm == "BFS":
@@ -1500,6 +1969,16 @@ Performance Notes:
         self.start_time = time.time()
         self.draw_maze()
 
+    def close(self):
+        """Close the window without waiting for background searches
+
+        Queued searches are cancelled and a running IDS stops at its next
+        depth, so the worker threads do not keep the process alive.
+        """
+        self.closing = True
+        self.search_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def run(self):
         """Start the game"""
         print("HARD Maze Game - Survival Mode with Multiple Search Algorithms")